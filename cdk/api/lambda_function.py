@@ -1,8 +1,9 @@
+import os
 import json
+import base64
 import boto3
 import urllib3
 import uuid
-import time
 from datetime import datetime
 
 s3 = boto3.client('s3')
@@ -10,30 +11,87 @@ http = urllib3.PoolManager()
 
 BUCKET_NAME = "cdkstack-inventorydatabucket1b7c2a3c-dsqfppsvh2hm"
 KEY_PREFIX = "raw/"
+SOURCE_URL = "https://random-data-api.com/api/commerce/random_commerce"
+
+# Most records accepted per invocation, fetched or POSTed
+BATCH_SIZE = int(os.environ.get("BATCH_SIZE", "100"))
+
+def fetch_records(count):
+    # One request for the whole batch instead of one per record
+    response = http.request('GET', SOURCE_URL, fields={'size': str(count)})
+    if response.status != 200:
+        raise RuntimeError(f"HTTP Error {response.status}: {response.data}")
+    data = json.loads(response.data.decode("utf-8"))
+    return data if isinstance(data, list) else [data]
+
+def parse_posted_records(event):
+    body = event.get('body') or '[]'
+    if event.get('isBase64Encoded'):
+        body = base64.b64decode(body).decode("utf-8")
+    data = json.loads(body)
+    return data if isinstance(data, list) else [data]
+
+def api_response(status_code, body):
+    return {
+        'statusCode': status_code,
+        'headers': {'Content-Type': 'application/json'},
+        'body': json.dumps(body)
+    }
 
 def handler(event, context):
-    for _ in range(3):  # Reduced to avoid rate limit
+    # API Gateway proxy POSTs carry their own records; scheduled runs fetch them
+    posted = isinstance(event, dict) and event.get('httpMethod') == 'POST'
+    if posted:
+        try:
+            candidates = parse_posted_records(event)
+        except ValueError as e:
+            return api_response(400, {'message': f"Invalid JSON body: {e}"})
+    else:
+        # Any failure here, including an undecodable upstream response, is upstream's fault
         try:
-            response = http.request('GET', 'https://random-data-api.com/api/commerce/random_commerce')
-            if response.status == 200:
-                record = json.loads(response.data.decode("utf-8"))
+            candidates = fetch_records(BATCH_SIZE)
+        except Exception as e:
+            print(f"Exception occurred: {str(e)}")
+            return api_response(502, {'message': f"Failed to fetch records: {e}"})
 
-                record["timestamp"] = datetime.utcnow().isoformat()
-                record["product_id"] = str(uuid.uuid4())
+    now = datetime.utcnow().isoformat()
+    statuses = []
+    accepted = []
+    for index, record in enumerate(candidates):
+        if not isinstance(record, dict):
+            statuses.append({'index': index, 'status': 'rejected', 'error': 'record must be a JSON object'})
+            continue
+        if len(accepted) >= BATCH_SIZE:
+            statuses.append({'index': index, 'status': 'rejected', 'error': f'batch limit of {BATCH_SIZE} exceeded'})
+            continue
 
-                key = f"{KEY_PREFIX}record-{record['product_id']}.json"
-                s3.put_object(Bucket=BUCKET_NAME, Key=key, Body=json.dumps(record))
+        if posted:
+            record.setdefault("timestamp", now)
+            record.setdefault("product_id", str(uuid.uuid4()))
+        else:
+            record["timestamp"] = now
+            record["product_id"] = str(uuid.uuid4())
 
-                print(f"Uploaded record to {key}")
-            else:
-                print(f"HTTP Error {response.status}: {response.data}")
+        accepted.append(record)
+        statuses.append({'index': index, 'status': 'accepted', 'product_id': record['product_id']})
 
+    key = None
+    if accepted:
+        # All records of the invocation go into a single newline-delimited object
+        key = f"{KEY_PREFIX}batch-{uuid.uuid4()}.json"
+        body = "\n".join(json.dumps(record) for record in accepted)
+        try:
+            s3.put_object(Bucket=BUCKET_NAME, Key=key, Body=body)
+            print(f"Uploaded {len(accepted)} records to {key}")
         except Exception as e:
             print(f"Exception occurred: {str(e)}")
+            for status in statuses:
+                if status['status'] == 'accepted':
+                    status.update(status='failed', error=str(e))
+            return api_response(500, {'message': 'Failed to write batch', 'records': statuses})
 
-        time.sleep(0.5)  # Prevent 429 errors
-
-    return {
-        'statusCode': 200,
-        'body': json.dumps('Successfully ingested data from Random Data API')
-    }
+    return api_response(200 if accepted or not candidates else 400, {
+        'message': f"Ingested {len(accepted)} of {len(candidates)} records",
+        'key': key,
+        'records': statuses
+    })
@@ -15,7 +15,8 @@ from __future__ import absolute_import
 
 import json
 import logging
-import tempfile
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from typing import Union, Optional, Dict
 
 from six.moves.urllib.parse import urlparse
@@ -454,14 +455,118 @@ def _build_shards(num_shards, array):
     return shards
 
 
+# Smallest part size S3 accepts for all but the last part of a multipart upload
+_MIN_PART_SIZE = 5 * 1024 * 1024
+
+# Most shards encoded and uploaded at the same time
+_MAX_SHARD_WORKERS = 32
+
+
+class _ShardUploadCancelled(Exception):
+    """Raised in a shard upload stopped because another shard failed."""
+
+
+class _MultipartUploadWriter(object):
+    """File-like object that streams what is written to it into an S3 multipart upload.
+
+    Objects smaller than a single part are uploaded with one ``put_object`` instead.
+    """
+
+    def __init__(
+        self, client, bucket, key, extra_put_kwargs, part_size=_MIN_PART_SIZE, stop_event=None
+    ):
+        """Initialize the writer.
+
+        Args:
+            client (boto3.client): S3 client.
+            bucket (str): Bucket of the object.
+            key (str): Key of the object.
+            extra_put_kwargs (dict): Extra arguments for creating the object.
+            part_size (int): Buffered bytes that trigger a part upload.
+            stop_event (threading.Event): Once set, the next part upload or ``close``
+                raises ``_ShardUploadCancelled`` instead of sending anything.
+        """
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._extra_put_kwargs = extra_put_kwargs
+        self._part_size = part_size
+        self._stop_event = stop_event
+        self._buffer = bytearray()
+        self._parts = []
+        self._upload_id = None
+
+    def write(self, data):
+        """Buffer data and upload a part once enough of it has been written."""
+        self._buffer += data
+        if len(self._buffer) >= self._part_size:
+            self._upload_part()
+
+    def _check_stopped(self):
+        """Raise ``_ShardUploadCancelled`` if the upload was asked to stop."""
+        if self._stop_event is not None and self._stop_event.is_set():
+            raise _ShardUploadCancelled("Upload of {} stopped".format(self._key))
+
+    def _upload_part(self):
+        """Upload the buffered bytes as the next part."""
+        self._check_stopped()
+        if self._upload_id is None:
+            self._upload_id = self._client.create_multipart_upload(
+                Bucket=self._bucket, Key=self._key, **self._extra_put_kwargs
+            )["UploadId"]
+        part_number = len(self._parts) + 1
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            PartNumber=part_number,
+            UploadId=self._upload_id,
+            Body=bytes(self._buffer),
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self._buffer = bytearray()
+
+    def close(self):
+        """Upload what is left and complete the object."""
+        self._check_stopped()
+        if self._upload_id is None:
+            self._client.put_object(
+                Bucket=self._bucket,
+                Key=self._key,
+                Body=bytes(self._buffer),
+                **self._extra_put_kwargs,
+            )
+            return
+        if self._buffer:
+            self._upload_part()
+        self._client.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+
+    def abort(self):
+        """Discard the parts uploaded so far."""
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
+
+
 def upload_numpy_to_s3_shards(
-    num_shards, s3, bucket, key_prefix, array, labels=None, encrypt=False
+    num_shards, s3, bucket, key_prefix, array, labels=None, encrypt=False, max_workers=None
 ):
     """Upload the training ``array`` and ``labels`` arrays to ``num_shards``.
 
     S3 objects, stored in "s3:// ``bucket`` / ``key_prefix`` /". Optionally
     ``encrypt`` the S3 objects using AES-256.
 
+    Shards are encoded and uploaded concurrently, each one streamed into a multipart
+    upload as it is encoded. The first shard to fail stops the others: shards not yet
+    started are cancelled, shards in progress abort their multipart uploads, and the
+    shards already uploaded are deleted. The manifest is only written if every shard
+    succeeds.
+
     Args:
         num_shards:
         s3:
@@ -470,6 +575,10 @@ def upload_numpy_to_s3_shards(
         array:
         labels:
         encrypt:
+        max_workers (int): Number of shards encoded and uploaded at the same time
+            (default: the number of shards, up to 32). It is capped at the
+            ``max_pool_connections`` of the S3 client (botocore default: 10), so raise
+            that in the client config to upload more shards at once.
     """
     shards = _build_shards(num_shards, array)
     if labels is not None:
@@ -478,20 +587,54 @@ def upload_numpy_to_s3_shards(
     if key_prefix[-1] != "/":
         key_prefix = key_prefix + "/"
     extra_put_kwargs = {"ServerSideEncryption": "AES256"} if encrypt else {}
+    # Resources are not thread-safe, but their underlying client is.
+    client = s3.meta.client
+    # set on the first failure, so the other shards stop uploading
+    stop_event = threading.Event()
+
+    def _upload_shard(shard_index):
+        shard_index_string = str(shard_index).zfill(len(str(len(shards))))
+        file_name = "matrix_{}.pbr".format(shard_index_string)
+        key = key_prefix + file_name
+        if stop_event.is_set():
+            raise _ShardUploadCancelled("Upload of {} stopped".format(key))
+        logger.debug("Creating object %s in bucket %s", key, bucket)
+        writer = _MultipartUploadWriter(
+            client, bucket, key, extra_put_kwargs, stop_event=stop_event
+        )
+        try:
+            if labels is not None:
+                write_numpy_to_dense_tensor(writer, shards[shard_index], label_shards[shard_index])
+            else:
+                write_numpy_to_dense_tensor(writer, shards[shard_index])
+            writer.close()
+        except Exception:  # pylint: disable=broad-except
+            writer.abort()
+            raise
+        return file_name
+
     try:
-        for shard_index, shard in enumerate(shards):
-            with tempfile.TemporaryFile() as file:
-                if labels is not None:
-                    write_numpy_to_dense_tensor(file, shard, label_shards[shard_index])
-                else:
-                    write_numpy_to_dense_tensor(file, shard)
-                file.seek(0)
-                shard_index_string = str(shard_index).zfill(len(str(len(shards))))
-                file_name = "matrix_{}.pbr".format(shard_index_string)
-                key = key_prefix + file_name
-                logger.debug("Creating object %s in bucket %s", key, bucket)
-                s3.Object(bucket, key).put(Body=file, **extra_put_kwargs)
-                uploaded_files.append(file_name)
+        # More threads than pooled connections would only wait for a connection.
+        max_pool_connections = getattr(client.meta.config, "max_pool_connections", None) or 10
+        workers = min(max_workers or _MAX_SHARD_WORKERS, len(shards), max_pool_connections)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_upload_shard, index) for index in range(len(shards))]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            if any(future.exception() is not None for future in done):
+                stop_event.set()
+                for future in futures:
+                    future.cancel()
+        # every shard has now finished, failed or been cancelled
+        error = None
+        for future in futures:
+            if future.cancelled():
+                continue
+            if future.exception() is None:
+                uploaded_files.append(future.result())
+            elif error is None or isinstance(error, _ShardUploadCancelled):
+                error = future.exception()
+        if error is not None:
+            raise error
         manifest_key = key_prefix + ".amazon.manifest"
         manifest_str = json.dumps(
             [{"prefix": "s3://{}/{}".format(bucket, key_prefix)}] + uploaded_files
@@ -0,0 +1,249 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""A shared tracker of async inference output and failure objects in Amazon S3"""
+from __future__ import absolute_import
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+
+from botocore.exceptions import ClientError
+
+from sagemaker.s3 import parse_s3_url
+
+logger = logging.getLogger(__name__)
+
+# Directories with at most this many watched keys are checked with HeadObject
+# rather than listed.
+_HEAD_OBJECT_LIMIT = 3
+
+# Most ListObjectsV2 pages requested for one directory per poll. Output keys are
+# random, so the range between the pending keys can span most of a large prefix;
+# keys past the pages listed are checked with HeadObject instead.
+_MAX_LIST_PAGES = 3
+
+
+class _Watch(object):
+    """The S3 objects a single caller waits for, and the future it waits on."""
+
+    __slots__ = ("future", "s3_uris", "targets", "delay", "deadline")
+
+    def __init__(self, s3_uris, targets, delay, deadline):
+        self.future = Future()
+        self.s3_uris = s3_uris
+        self.targets = targets
+        self.delay = delay
+        self.deadline = deadline
+
+
+class CompletionTracker(object):
+    """Waits for many Amazon S3 objects to appear with a single polling thread.
+
+    Each call to ``watch`` returns a future that resolves to the first of its S3 URIs
+    found to exist. Watched keys that share a directory are checked together with a
+    ranged ``ListObjectsV2`` call, so the number of requests per poll grows with the
+    number of directories rather than the number of outstanding inferences. Small
+    groups, buckets that cannot be listed, and keys past the first few listed pages
+    are checked with ``HeadObject``.
+
+    The polling thread is started on the first watch and exits once nothing is
+    being watched.
+    """
+
+    def __init__(self):
+        """Initialize a ``CompletionTracker``."""
+        self._lock = threading.Lock()
+        # (s3_client, bucket, key) -> list of _Watch
+        self._watches = {}
+        # (s3_client, bucket) pairs for which ListObjectsV2 is denied
+        self._unlistable = set()
+        self._thread = None
+
+    def watch(self, s3_client, s3_uris, delay=15, timeout=None):
+        """Wait for any of ``s3_uris`` to exist.
+
+        Args:
+            s3_client (boto3.client): The S3 client used to check for the objects.
+            s3_uris (list[str]): Amazon S3 URIs of the objects to wait for.
+            delay (float): Seconds between checks (Default: 15). The tracker polls
+                at the shortest delay of all the pending watches.
+            timeout (float): Seconds after which the future resolves to None if no
+                object was found. None waits indefinitely (Default: None).
+
+        Returns:
+            concurrent.futures.Future: Resolves to the first URI found, to None on
+                timeout, or to the error raised while checking an object.
+        """
+        targets = []
+        for s3_uri in s3_uris:
+            bucket, key = parse_s3_url(s3_uri)
+            targets.append((s3_client, bucket, key))
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        watch = _Watch(list(s3_uris), targets, delay, deadline)
+
+        with self._lock:
+            for target in targets:
+                self._watches.setdefault(target, []).append(watch)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sagemaker-async-inference-tracker", daemon=True
+                )
+                self._thread.start()
+        return watch.future
+
+    def _run(self):
+        """Poll the watched objects until there is nothing left to watch."""
+        try:
+            while True:
+                with self._lock:
+                    self._expire_watches()
+                    if not self._watches:
+                        self._thread = None
+                        return
+                    targets = list(self._watches)
+                    delay = min(w.delay for watches in self._watches.values() for w in watches)
+
+                try:
+                    found, errors = self._check_targets(targets)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Failed to check async inference results, retrying.")
+                    found, errors = set(), {}
+
+                with self._lock:
+                    resolved = {
+                        watch for target in found for watch in self._watches.get(target, ())
+                    }
+                    for watch in resolved:
+                        self._remove_watch(watch)
+                        # the earliest URI of the watch wins if several were found at once
+                        index = next(
+                            i for i, target in enumerate(watch.targets) if target in found
+                        )
+                        _resolve(watch.future, result=watch.s3_uris[index])
+                    for target, error in errors.items():
+                        for watch in list(self._watches.get(target, ())):
+                            self._remove_watch(watch)
+                            _resolve(watch.future, error=error)
+                time.sleep(delay)
+        finally:
+            # lets the next watch start a new polling thread, even if this one failed
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _expire_watches(self):
+        """Resolve timed out watches to None and drop cancelled ones. Requires the lock."""
+        now = time.monotonic()
+        expired = {
+            watch
+            for watches in self._watches.values()
+            for watch in watches
+            if watch.future.done() or (watch.deadline is not None and watch.deadline <= now)
+        }
+        for watch in expired:
+            self._remove_watch(watch)
+            _resolve(watch.future, result=None)
+
+    def _remove_watch(self, watch):
+        """Stop watching the targets of ``watch``. Requires the lock."""
+        for target in watch.targets:
+            watches = self._watches.get(target)
+            if watches and watch in watches:
+                watches.remove(watch)
+                if not watches:
+                    del self._watches[target]
+
+    def _check_targets(self, targets):
+        """Check which of ``targets`` exist, one request group per S3 directory.
+
+        Returns:
+            tuple[set, dict]: The targets that exist, and the error of every target
+                that could not be checked.
+        """
+        groups = {}
+        for s3_client, bucket, key in targets:
+            prefix = key[: key.rfind("/") + 1]
+            groups.setdefault((s3_client, bucket, prefix), []).append(key)
+
+        found = set()
+        errors = {}
+        for (s3_client, bucket, prefix), keys in groups.items():
+            if len(keys) > _HEAD_OBJECT_LIMIT and (s3_client, bucket) not in self._unlistable:
+                try:
+                    existing, keys = _list_existing_keys(s3_client, bucket, prefix, keys)
+                    found.update((s3_client, bucket, key) for key in existing)
+                except ClientError as e:
+                    if e.response["Error"]["Code"] not in ("AccessDenied", "403"):
+                        logger.warning(
+                            "Failed to list s3://%s/%s, retrying on the next poll: %s",
+                            bucket,
+                            prefix,
+                            e,
+                        )
+                        continue
+                    logger.debug("Falling back to HeadObject for bucket %s: %s", bucket, e)
+                    self._unlistable.add((s3_client, bucket))
+
+            for key in keys:
+                try:
+                    s3_client.head_object(Bucket=bucket, Key=key)
+                    found.add((s3_client, bucket, key))
+                except ClientError as e:
+                    if e.response["Error"]["Code"] not in ("404", "NoSuchKey"):
+                        errors[(s3_client, bucket, key)] = e
+        return found, errors
+
+
+def _resolve(future, result=None, error=None):
+    """Set the result or error of ``future``, unless the caller already cancelled it."""
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+def _list_existing_keys(s3_client, bucket, prefix, keys):
+    """Find which of ``keys`` exist, listing only the key range they span.
+
+    At most ``_MAX_LIST_PAGES`` pages are listed.
+
+    Returns:
+        tuple[set, list]: The keys that exist, and the keys past the listed range,
+            which were not checked.
+    """
+    keys = sorted(keys)
+    wanted = set(keys)
+    existing = set()
+    # Any prefix of the smallest key sorts before it.
+    request_args = {"Bucket": bucket, "Prefix": prefix, "StartAfter": keys[0][:-1]}
+    for _ in range(_MAX_LIST_PAGES):
+        response = s3_client.list_objects_v2(**request_args)
+        contents = response.get("Contents", [])
+        existing.update(obj["Key"] for obj in contents if obj["Key"] in wanted)
+        if not response.get("IsTruncated") or (contents and contents[-1]["Key"] >= keys[-1]):
+            return existing, []
+        request_args["ContinuationToken"] = response["NextContinuationToken"]
+    last_listed = contents[-1]["Key"] if contents else keys[0][:-1]
+    return existing, [key for key in keys if key > last_listed]
+
+
+_COMPLETION_TRACKER = CompletionTracker()
+
+
+def get_completion_tracker():
+    """Return the ``CompletionTracker`` shared by the whole process."""
+    return _COMPLETION_TRACKER
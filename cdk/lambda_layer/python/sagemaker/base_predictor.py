@@ -15,9 +15,16 @@ from __future__ import print_function, absolute_import
 
 import abc
 import datetime
-from typing import Any, Dict, Optional, Tuple, Union
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 import logging
 
+import botocore.config
+import botocore.exceptions
+
 from sagemaker.enums import EndpointType
 from sagemaker.deprecations import (
     deprecated_class,
@@ -68,6 +75,16 @@ LOGGER = logging.getLogger("sagemaker")
 
 logger = logging.getLogger(__name__)
 
+# Real-time endpoints reject request bodies larger than 6 MB.
+MAX_PAYLOAD_BYTES = 6 * 1024 * 1024
+# botocore's default connection pool size.
+DEFAULT_BATCH_MAX_WORKERS = 10
+DEFAULT_BATCH_MAX_RETRIES = 5
+_BATCH_SIZE_SAMPLE_ROWS = 100
+_RETRYABLE_ERROR_CODES = frozenset(
+    ("ThrottlingException", "TooManyRequestsException", "ServiceUnavailable")
+)
+
 
 class PredictorBase(abc.ABC):
     """An object that encapsulates a deployed model."""
@@ -144,6 +161,8 @@ class Predictor(PredictorBase):
         self._context = None
         self._content_type = None
         self._accept = None
+        self._batch_runtime_client = None
+        self.batch_stats = None
 
     def predict(
         self,
@@ -371,6 +390,176 @@ class Predictor(PredictorBase):
         )
         return iterator(response["Body"])
 
+    def predict_batch(
+        self,
+        data,
+        batch_size: Optional[int] = None,
+        max_payload_bytes: int = MAX_PAYLOAD_BYTES,
+        max_workers: int = DEFAULT_BATCH_MAX_WORKERS,
+        max_retries: int = DEFAULT_BATCH_MAX_RETRIES,
+        initial_args=None,
+        target_model=None,
+        target_variant=None,
+        custom_attributes=None,
+        component_name: Optional[str] = None,
+    ) -> List[Any]:
+        """Return the inferences for many rows, sent to the endpoint in concurrent chunks.
+
+        ``data`` is split into chunks of ``batch_size`` rows. A chunk whose serialized
+        body exceeds ``max_payload_bytes`` is halved until it fits. Chunks are sent
+        from a pool of ``max_workers`` threads sharing one runtime client, whose
+        connection pool is sized to match. Throttled requests are retried with
+        exponential backoff and jitter.
+
+        Latency percentiles and throughput of the call are logged and kept in
+        ``batch_stats``.
+
+        Args:
+            data (object): Rows to send. Any sequence supporting ``len`` and slicing,
+                such as a list, a ``numpy.ndarray`` or a ``pandas.DataFrame``. Each
+                chunk is encoded with the predictor's serializer.
+            batch_size (int): Rows per request. If not specified, it is estimated from
+                the serialized size of the first rows (Default: None).
+            max_payload_bytes (int): Largest request body to send
+                (Default: ``MAX_PAYLOAD_BYTES``).
+            max_workers (int): Number of requests in flight at a time (Default: 10).
+            max_retries (int): Retries of a throttled chunk before giving up (Default: 5).
+            initial_args (dict[str,str]): Optional. Default arguments for boto3
+                ``invoke_endpoint`` call. Default is None (no default arguments).
+            target_model (str): S3 model artifact path to run an inference request on,
+                in case of a multi model endpoint (Default: None).
+            target_variant (str): The name of the production variant to run an inference
+                request on (Default: None).
+            custom_attributes (str): Provides additional information about a request for an
+                inference submitted to a model hosted at an Amazon SageMaker endpoint
+                (Default: None).
+            component_name (str): Optional. Name of the Amazon SageMaker inference component
+                corresponding the predictor.
+
+        Returns:
+            list: The deserialized inference of every request, in the order of the rows
+                they cover.
+        """
+        num_rows = len(data)
+        if num_rows == 0:
+            return []
+        if batch_size is None:
+            batch_size = self._estimate_batch_size(data, max_payload_bytes)
+        max_workers = max(1, min(max_workers, -(-num_rows // batch_size)))
+        runtime_client = self._get_batch_runtime_client(max_workers)
+        inference_component_name = component_name or self._get_component_name()
+        latencies = []
+        retries = [0]
+        lock = threading.Lock()
+
+        def _invoke(request_args):
+            attempt = 0
+            while True:
+                start = time.perf_counter()
+                try:
+                    response = runtime_client.invoke_endpoint(**request_args)
+                    result = self._handle_response(response)
+                except botocore.exceptions.ClientError as e:
+                    code = e.response.get("Error", {}).get("Code")
+                    if code not in _RETRYABLE_ERROR_CODES or attempt == max_retries:
+                        raise
+                    with lock:
+                        retries[0] += 1
+                    time.sleep(random.uniform(0, 0.1 * 2**attempt))
+                    attempt += 1
+                    continue
+                with lock:
+                    latencies.append(time.perf_counter() - start)
+                return result
+
+        def _predict_rows(start, end):
+            request_args = self._create_request_args(
+                data=_slice_rows(data, start, end),
+                initial_args=initial_args,
+                target_model=target_model,
+                target_variant=target_variant,
+                custom_attributes=custom_attributes,
+            )
+            if end - start > 1 and _payload_size(request_args["Body"]) > max_payload_bytes:
+                middle = (start + end) // 2
+                return _predict_rows(start, middle) + _predict_rows(middle, end)
+            if inference_component_name:
+                request_args["InferenceComponentName"] = inference_component_name
+            return [_invoke(request_args)]
+
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_predict_rows, start, min(start + batch_size, num_rows))
+                for start in range(0, num_rows, batch_size)
+            ]
+            try:
+                results = [result for future in futures for result in future.result()]
+            finally:
+                for future in futures:
+                    future.cancel()
+        elapsed = time.perf_counter() - start_time
+
+        latencies.sort()
+        self.batch_stats = {
+            "rows": num_rows,
+            "requests": len(latencies),
+            "retries": retries[0],
+            "elapsed_seconds": elapsed,
+            "rows_per_second": num_rows / elapsed if elapsed else float("inf"),
+            "p50_latency_seconds": _percentile(latencies, 50),
+            "p99_latency_seconds": _percentile(latencies, 99),
+        }
+        logger.info(
+            "Predicted %d rows in %d requests (%d retries) in %.2fs: %.1f rows/s, "
+            "p50 %.3fs, p99 %.3fs",
+            num_rows,
+            len(latencies),
+            retries[0],
+            elapsed,
+            self.batch_stats["rows_per_second"],
+            self.batch_stats["p50_latency_seconds"],
+            self.batch_stats["p99_latency_seconds"],
+        )
+        return results
+
+    def _estimate_batch_size(self, data, max_payload_bytes):
+        """Rows per request that keep the body within ``max_payload_bytes``.
+
+        The size of a row is estimated from the serialized first rows, with 10%
+        headroom. Chunks that still come out too large are split when sent.
+        """
+        sample_rows = min(len(data), _BATCH_SIZE_SAMPLE_ROWS)
+        sample_size = _payload_size(self.serializer.serialize(_slice_rows(data, 0, sample_rows)))
+        if not sample_size:
+            return len(data)
+        return max(1, int(max_payload_bytes * 0.9 * sample_rows / sample_size))
+
+    def _get_batch_runtime_client(self, max_workers):
+        """Runtime client whose connection pool can serve ``max_workers`` threads.
+
+        The session's client is used when its pool is large enough, or when it is
+        not a botocore client (e.g. in local mode). Otherwise a client with the
+        same configuration and a larger pool is created and reused.
+        """
+        client = self.sagemaker_session.sagemaker_runtime_client
+        meta = getattr(client, "meta", None)
+        if meta is None or (meta.config.max_pool_connections or 0) >= max_workers:
+            return client
+
+        batch_client = self._batch_runtime_client
+        if batch_client is None or batch_client.meta.config.max_pool_connections < max_workers:
+            batch_client = self.sagemaker_session.boto_session.client(
+                meta.service_model.service_name,
+                region_name=meta.region_name,
+                endpoint_url=meta.endpoint_url,
+                config=meta.config.merge(
+                    botocore.config.Config(max_pool_connections=max_workers)
+                ),
+            )
+            self._batch_runtime_client = batch_client
+        return batch_client
+
     def update_endpoint(
         self,
         initial_instance_count=None,
@@ -961,6 +1150,30 @@ class Predictor(PredictorBase):
         return self.endpoint_name
 
 
+def _slice_rows(data, start, end):
+    """Rows ``start`` to ``end`` of a list, array or ``pandas.DataFrame``."""
+    if hasattr(data, "iloc"):
+        return data.iloc[start:end]
+    return data[start:end]
+
+
+def _payload_size(body):
+    """Size in bytes of a serialized request body, or 0 if it is a stream."""
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        return len(body)
+    return 0
+
+
+def _percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list, or 0.0 if it is empty."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
 csv_serializer = deprecated_serialize(CSVSerializer(), "csv_serializer")
 json_serializer = deprecated_serialize(JSONSerializer(), "json_serializer")
 npy_serializer = deprecated_serialize(NumpySerializer(), "npy_serializer")
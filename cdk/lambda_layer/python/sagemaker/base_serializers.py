@@ -18,6 +18,7 @@ from collections.abc import Iterable
 import csv
 import io
 import json
+import os
 import numpy as np
 from pandas import DataFrame
 from six import with_metaclass
@@ -30,6 +31,10 @@ try:
 except ImportError as e:
     scipy = DeferredError(e)
 
+# Rows formatted per string formatting call by the bulk CSV path. Bounds the
+# memory taken by the intermediate Python values.
+_CSV_FORMAT_CHUNK_ROWS = 65536
+
 
 class BaseSerializer(abc.ABC):
     """Abstract base class for creation of new serializers.
@@ -110,8 +115,17 @@ class CSVSerializer(SimpleBaseSerializer):
             return data.read()
 
         if isinstance(data, DataFrame):
+            values = self._numeric_frame_values(data)
+            if values is not None:
+                # to_csv ends every line, including the last, with os.linesep
+                return _format_csv_rows(values, os.linesep) + os.linesep
             return data.to_csv(header=False, index=False)
 
+        if isinstance(data, np.ndarray) and data.ndim > 0 and data.size > 0:
+            if data.dtype.kind in "biuf":
+                rows = data.reshape(len(data), -1) if data.ndim > 1 else data.reshape(1, -1)
+                return _format_csv_rows(rows, "\n")
+
         is_mutable_sequence_like = self._is_sequence_like(data) and hasattr(data, "__setitem__")
         has_multiple_rows = len(data) > 0 and self._is_sequence_like(data[0])
 
@@ -149,6 +163,59 @@ class CSVSerializer(SimpleBaseSerializer):
         """Returns true if obj is iterable and subscriptable."""
         return hasattr(data, "__iter__") and hasattr(data, "__getitem__")
 
+    def _numeric_frame_values(self, data):
+        """Return the values of a DataFrame that can be formatted in bulk, or None.
+
+        That is a non-empty DataFrame whose columns share one integer, boolean or
+        float64 dtype, without missing values, which ``to_csv`` writes as empty fields.
+        """
+        dtypes = set(data.dtypes)
+        if data.size == 0 or len(dtypes) != 1:
+            return None
+        dtype = dtypes.pop()
+        if not isinstance(dtype, np.dtype) or not (dtype.kind in "biu" or dtype == np.float64):
+            return None
+        values = data.to_numpy()
+        if dtype.kind == "f" and np.isnan(values).any():
+            return None
+        return values
+
+
+def _format_csv_rows(rows, line_terminator):
+    """Format a non-empty 2-D numeric array as CSV lines, without a trailing terminator.
+
+    Values are written as ``str`` of their NumPy scalar, as ``csv.writer`` does. Rows
+    are formatted in chunks with a single ``%`` operation each, instead of going
+    through a ``csv.writer`` per row.
+
+    Args:
+        rows (numpy.ndarray): 2-D array of a boolean, integer or float dtype.
+        line_terminator (str): String placed between rows.
+
+    Returns:
+        str: The CSV-formatted rows.
+    """
+    if rows.dtype.kind in "biu" or rows.dtype == np.float64:
+        # Python ints, bools and floats have the same repr as the NumPy scalars' str.
+        placeholder = "%r"
+
+        def to_values(chunk):
+            return chunk.ravel().tolist()
+
+    else:
+        # Other float widths would lose their shortest representation as Python floats.
+        placeholder = "%s"
+
+        def to_values(chunk):
+            return chunk.astype(str).ravel().tolist()
+
+    line = ",".join([placeholder] * rows.shape[1])
+    chunks = []
+    for start in range(0, len(rows), _CSV_FORMAT_CHUNK_ROWS):
+        chunk = rows[start : start + _CSV_FORMAT_CHUNK_ROWS]
+        chunks.append(line_terminator.join([line] * len(chunk)) % tuple(to_values(chunk)))
+    return line_terminator.join(chunks)
+
 
 class NumpySerializer(SimpleBaseSerializer):
     """Serialize data to a buffer using the .npy format."""
@@ -13,10 +13,12 @@
 """Functions for generating ECR image URIs for pre-built SageMaker Docker images."""
 from __future__ import absolute_import
 
+import copy
 import json
 import logging
 import os
 import re
+from functools import lru_cache
 from typing import Optional
 from packaging.version import Version
 
@@ -49,6 +51,11 @@ DATA_WRANGLER_FRAMEWORK = "data-wrangler"
 STABILITYAI_FRAMEWORK = "stabilityai"
 SAGEMAKER_TRITONSERVER_FRAMEWORK = "sagemaker-tritonserver"
 
+# Image URIs already resolved in this process, keyed by the arguments of ``retrieve`` that
+# determine them: framework, image scope, version, region, instance type (hence processor)
+# and the remaining optional framework arguments.
+_IMAGE_URI_INDEX = {}
+
 
 @override_pipeline_parameter_var
 def retrieve(
@@ -182,6 +189,28 @@ def retrieve(
             model_type=model_type,
         )
 
+    index_key = None
+    if (
+        distribution is None
+        and training_compiler_config is None
+        and serverless_inference_config is None
+    ):
+        index_key = (
+            framework,
+            image_scope,
+            version,
+            region,
+            instance_type,
+            py_version,
+            accelerator_type,
+            container_version,
+            base_framework_version,
+            sdk_version,
+            inference_tool,
+        )
+        if index_key in _IMAGE_URI_INDEX:
+            return _IMAGE_URI_INDEX[index_key]
+
     if training_compiler_config and (framework in [HUGGING_FACE_FRAMEWORK, "pytorch"]):
         final_image_scope = image_scope
         config = _config_for_framework_and_scope(
@@ -292,7 +321,10 @@ def retrieve(
     if tag:
         repo += ":{}".format(tag)
 
-    return ECR_URI_TEMPLATE.format(registry=registry, hostname=hostname, repository=repo)
+    image_uri = ECR_URI_TEMPLATE.format(registry=registry, hostname=hostname, repository=repo)
+    if index_key is not None:
+        _IMAGE_URI_INDEX[index_key] = image_uri
+    return image_uri
 
 
 def _get_image_tag(
@@ -365,8 +397,11 @@ def _get_image_tag(
 
 
 def _config_for_framework_and_scope(framework, image_scope, accelerator_type=None):
-    """Loads the JSON config for the given framework and image scope."""
-    config = config_for_framework(framework)
+    """Loads the JSON config for the given framework and image scope.
+
+    The returned config is shared by all callers and must not be modified.
+    """
+    config = _load_config(framework)
 
     if accelerator_type:
         _validate_accelerator_type(accelerator_type)
@@ -434,6 +469,15 @@ def _validate_for_suppported_frameworks_and_instance_type(framework, instance_ty
 
 def config_for_framework(framework):
     """Loads the JSON config for the given framework."""
+    return copy.deepcopy(_load_config(framework))
+
+
+@lru_cache(maxsize=None)
+def _load_config(framework):
+    """Loads the JSON config for the given framework once per process.
+
+    The returned config is shared by all callers and must not be modified.
+    """
     fname = os.path.join(os.path.dirname(__file__), "image_uri_config", "{}.json".format(framework))
     with open(fname) as f:
         return json.load(f)
@@ -474,7 +518,7 @@ def _get_latest_version(framework, version, image_scope):
     if version:
         return version
     try:
-        framework_config = config_for_framework(framework)
+        framework_config = _load_config(framework)
     except FileNotFoundError:
         raise ValueError("Invalid framework {}".format(framework))
 
@@ -498,7 +542,7 @@ def _validate_accelerator_type(accelerator_type):
 def _validate_version_and_set_if_needed(version, config, framework, image_scope):
     """Checks if the framework/algorithm version is one of the supported versions."""
     if not config:
-        config = config_for_framework(framework)
+        config = _load_config(framework)
     available_versions = list(config["versions"].keys())
     aliased_versions = list(config.get("version_aliases", {}).keys())
     if len(available_versions) == 1 and version not in aliased_versions:
@@ -748,7 +792,7 @@ def get_base_python_image_uri(region, py_version="310") -> str:
     if region == "il-central-1" and not endpoint_data:
         endpoint_data = {"hostname": "ecr.{}.amazonaws.com".format(region)}
     hostname = endpoint_data["hostname"]
-    config = config_for_framework(framework)
+    config = _load_config(framework)
     version_config = config["versions"][_version_for_config(version, config)]
 
     registry = _registry_from_region(region, version_config["registries"])
@@ -184,3 +184,107 @@ class LineIterator(BaseIterator):
                 continue
             self.buffer.seek(0, io.SEEK_END)
             self.buffer.write(chunk["PayloadPart"]["Bytes"])
+
+
+class BaseAsyncIterator(ABC):
+    """Abstract base class for asynchronous Inference Streaming iterators.
+
+    The counterpart of :class:`~sagemaker.iterators.BaseIterator` for ``async for`` loops.
+    It accepts an asynchronous iterable of event stream chunks, shaped like those of a
+    `botocore.eventstream.EventStream` response, and overrides ``__aiter__`` and
+    ``__anext__``.
+    """
+
+    def __init__(self, event_stream):
+        """Initialises an asynchronous Iterator object.
+
+        Args:
+            event_stream: An asynchronous iterable of event stream chunks.
+        """
+        self.event_stream = event_stream
+
+    @abstractmethod
+    def __aiter__(self):
+        """Abstract method, returns an asynchronous iterator object itself"""
+        return self
+
+    @abstractmethod
+    async def __anext__(self):
+        """Abstract method, is responsible for returning the next element in the iteration"""
+
+
+class AsyncByteIterator(BaseAsyncIterator):
+    """Asynchronous version of :class:`~sagemaker.iterators.ByteIterator`."""
+
+    def __init__(self, event_stream):
+        """Initialises an AsyncByteIterator Iterator object
+
+        Args:
+            event_stream: An asynchronous iterable of event stream chunks.
+        """
+        super().__init__(event_stream)
+        self.byte_iterator = event_stream.__aiter__()
+
+    def __aiter__(self):
+        """Returns an asynchronous iterator object itself."""
+        return self
+
+    async def __anext__(self):
+        """Returns the next chunk of Byte directly."""
+        while True:
+            chunk = await self.byte_iterator.__anext__()
+            if "PayloadPart" not in chunk:
+                # handle API response errors and force terminate.
+                handle_stream_errors(chunk)
+                # print and move on to next response byte
+                print("Unknown event type:" + str(chunk))
+                continue
+            return chunk["PayloadPart"]["Bytes"]
+
+
+class AsyncLineIterator(BaseAsyncIterator):
+    """Asynchronous version of :class:`~sagemaker.iterators.LineIterator`.
+
+    Lines split across PayloadPart events are reassembled the same way, and each line
+    is returned without its trailing newline.
+    """
+
+    def __init__(self, event_stream):
+        """Initialises an AsyncLineIterator Iterator object
+
+        Args:
+            event_stream: An asynchronous iterable of event stream chunks.
+        """
+        super().__init__(event_stream)
+        self.byte_iterator = event_stream.__aiter__()
+        self.buffer = io.BytesIO()
+        self.read_pos = 0
+
+    def __aiter__(self):
+        """Returns an asynchronous iterator object itself."""
+        return self
+
+    async def __anext__(self):
+        """Returns the next Line from the event stream."""
+        while True:
+            self.buffer.seek(self.read_pos)
+            line = self.buffer.readline()
+            if line and line[-1] == ord("\n"):
+                self.read_pos += len(line)
+                return line[:-1]
+            try:
+                chunk = await self.byte_iterator.__anext__()
+            except StopAsyncIteration:
+                # a last line without a trailing newline is returned as is
+                if self.read_pos < self.buffer.getbuffer().nbytes:
+                    self.read_pos += len(line)
+                    return line
+                raise
+            if "PayloadPart" not in chunk:
+                # handle API response errors and force terminate.
+                handle_stream_errors(chunk)
+                # print and move on to next response byte
+                print("Unknown event type:" + str(chunk))
+                continue
+            self.buffer.seek(0, io.SEEK_END)
+            self.buffer.write(chunk["PayloadPart"]["Bytes"])
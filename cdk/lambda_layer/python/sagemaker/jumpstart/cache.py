@@ -14,7 +14,10 @@
 from __future__ import absolute_import
 import datetime
 from difflib import get_close_matches
+import hashlib
 import os
+import tempfile
+import time
 from typing import Any, Dict, List, Optional, Tuple, Union
 import json
 import boto3
@@ -23,6 +26,7 @@ from packaging.version import Version
 from packaging.specifiers import SpecifierSet, InvalidSpecifier
 from sagemaker.jumpstart.constants import (
     DEFAULT_JUMPSTART_SAGEMAKER_SESSION,
+    ENV_VARIABLE_JUMPSTART_DISK_CACHE_DIR,
     ENV_VARIABLE_JUMPSTART_MANIFEST_LOCAL_ROOT_DIR_OVERRIDE,
     ENV_VARIABLE_JUMPSTART_SPECS_LOCAL_ROOT_DIR_OVERRIDE,
     JUMPSTART_DEFAULT_MANIFEST_FILE_S3_KEY,
@@ -37,6 +41,7 @@ from sagemaker.jumpstart.exceptions import (
     get_wildcard_proprietary_model_version_msg,
 )
 from sagemaker.jumpstart.parameters import (
+    JUMPSTART_DEFAULT_DISK_CACHE_EXPIRATION_HORIZON,
     JUMPSTART_DEFAULT_MAX_S3_CACHE_ITEMS,
     JUMPSTART_DEFAULT_MAX_SEMANTIC_VERSION_CACHE_ITEMS,
     JUMPSTART_DEFAULT_S3_CACHE_EXPIRATION_HORIZON,
@@ -58,7 +63,7 @@ from sagemaker.jumpstart.hub.parsers import (
 )
 from sagemaker.jumpstart.enums import JumpStartModelType
 from sagemaker.jumpstart import utils
-from sagemaker.utilities.cache import LRUCache
+from sagemaker.utilities.cache import ThreadSafeLRUCache
 from sagemaker.session import Session
 
 
@@ -86,6 +91,10 @@ class JumpStartModelsCache:
         s3_client_config: Optional[botocore.config.Config] = None,
         s3_client: Optional[boto3.client] = None,
         sagemaker_session: Optional[Session] = DEFAULT_JUMPSTART_SAGEMAKER_SESSION,
+        disk_cache_dir: Optional[str] = None,
+        disk_cache_expiration_horizon: datetime.timedelta = (
+            JUMPSTART_DEFAULT_DISK_CACHE_EXPIRATION_HORIZON
+        ),
     ) -> None:
         """Initialize a ``JumpStartModelsCache`` instance.
 
@@ -109,25 +118,33 @@ class JumpStartModelsCache:
             s3_client (Optional[boto3.client]): s3 client to use. Default: None.
             sagemaker_session: sagemaker session object to use.
                 Default: session object from default region us-west-2.
+            disk_cache_dir (Optional[str]): Directory in which the JSON files fetched from s3
+                are also stored, so that other processes can reuse them.
+                Default: value of the ``AWS_JUMPSTART_DISK_CACHE_DIR`` environment
+                variable, or None (no disk cache).
+            disk_cache_expiration_horizon (datetime.timedelta): Maximum time to use a file
+                from the disk cache before revalidating its etag with s3. Default: 6 hours.
         """
 
         self._region = region or utils.get_region_fallback(
             s3_bucket_name=s3_bucket_name, s3_client=s3_client
         )
 
-        self._content_cache = LRUCache[JumpStartCachedContentKey, JumpStartCachedContentValue](
+        self._content_cache = ThreadSafeLRUCache[
+            JumpStartCachedContentKey, JumpStartCachedContentValue
+        ](
             max_cache_items=max_s3_cache_items,
             expiration_horizon=s3_cache_expiration_horizon,
             retrieval_function=self._retrieval_function,
         )
-        self._open_weight_model_id_manifest_key_cache = LRUCache[
+        self._open_weight_model_id_manifest_key_cache = ThreadSafeLRUCache[
             JumpStartVersionedModelId, JumpStartVersionedModelId
         ](
             max_cache_items=max_semantic_version_cache_items,
             expiration_horizon=semantic_version_cache_expiration_horizon,
             retrieval_function=self._get_open_weight_manifest_key_from_model_id,
         )
-        self._proprietary_model_id_manifest_key_cache = LRUCache[
+        self._proprietary_model_id_manifest_key_cache = ThreadSafeLRUCache[
             JumpStartVersionedModelId, JumpStartVersionedModelId
         ](
             max_cache_items=max_semantic_version_cache_items,
@@ -152,6 +169,10 @@ class JumpStartModelsCache:
         )
         # Fallback in case a caller overrides sagemaker_session to None
         self._sagemaker_session = sagemaker_session or DEFAULT_JUMPSTART_SAGEMAKER_SESSION
+        self._disk_cache_dir = disk_cache_dir or os.environ.get(
+            ENV_VARIABLE_JUMPSTART_DISK_CACHE_DIR
+        )
+        self._disk_cache_expiration_horizon = disk_cache_expiration_horizon
 
     def set_region(self, region: str) -> None:
         """Set region for cache. Clears cache after new region is set."""
@@ -349,11 +370,89 @@ class JumpStartModelsCache:
             key, value, model_type=JumpStartModelType.PROPRIETARY
         )
 
-    def _get_json_file_and_etag_from_s3(self, key: str) -> Tuple[Union[dict, list], str]:
-        """Returns json file from s3, along with its etag."""
-        response = self._s3_client.get_object(Bucket=self.s3_bucket_name, Key=key)
+    def _get_json_file_and_etag_from_s3(
+        self, key: str, if_none_match: Optional[str] = None
+    ) -> Tuple[Optional[Union[dict, list]], str]:
+        """Returns json file from s3, along with its etag.
+
+        If ``if_none_match`` is given and is still the etag of the s3 object, the object is
+        not downloaded and None is returned along with the etag.
+        """
+        extra_args = {"IfNoneMatch": if_none_match} if if_none_match else {}
+        try:
+            response = self._s3_client.get_object(
+                Bucket=self.s3_bucket_name, Key=key, **extra_args
+            )
+        except botocore.exceptions.ClientError as e:
+            if if_none_match and e.response["Error"]["Code"] in {"304", "NotModified"}:
+                return None, if_none_match
+            raise
         return json.loads(response["Body"].read().decode("utf-8")), response["ETag"]
 
+    def _get_disk_cache_path(self, key: str) -> str:
+        """Returns path of the disk cache file for an s3 key of the cache's bucket."""
+        digest = hashlib.sha256(f"{self.s3_bucket_name}/{key}".encode("utf-8")).hexdigest()
+        return os.path.join(self._disk_cache_dir, f"{digest}.json")
+
+    def _read_disk_cache(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the disk cache entry for an s3 key, or None if there is no valid one."""
+        try:
+            with open(self._get_disk_cache_path(key), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(entry, dict)
+            or entry.get("bucket") != self.s3_bucket_name
+            or entry.get("key") != key
+        ):
+            return None
+        return entry
+
+    def _write_disk_cache(self, key: str, body: Union[dict, list], etag: str) -> None:
+        """Stores json file and etag of an s3 key in the disk cache.
+
+        The file is written to a temporary file that is then renamed, so concurrent readers
+        never see a partial file. Failures are logged and otherwise ignored.
+        """
+        entry = {
+            "bucket": self.s3_bucket_name,
+            "key": key,
+            "etag": etag,
+            "fetched_at": time.time(),
+            "body": body,
+        }
+        temp_path = None
+        try:
+            os.makedirs(self._disk_cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self._disk_cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(temp_path, self._get_disk_cache_path(key))
+        except OSError as e:
+            JUMPSTART_LOGGER.debug("Unable to write JumpStart disk cache for %s: %s", key, e)
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _get_json_file_from_disk_cache_or_s3(self, key: str) -> Tuple[Union[dict, list], str]:
+        """Returns json file and etag from the disk cache, falling back to s3.
+
+        Files older than the disk cache expiration horizon are revalidated with a
+        conditional s3 request, which only downloads them again if their etag changed.
+        """
+        entry = self._read_disk_cache(key)
+        if entry is None:
+            body, etag = self._get_json_file_and_etag_from_s3(key)
+        else:
+            age = time.time() - entry.get("fetched_at", 0)
+            if age <= self._disk_cache_expiration_horizon.total_seconds():
+                return entry["body"], entry["etag"]
+            body, etag = self._get_json_file_and_etag_from_s3(key, if_none_match=entry["etag"])
+            if body is None:
+                body = entry["body"]
+        self._write_disk_cache(key, body, etag)
+        return body, etag
+
     def _is_local_metadata_mode(self) -> bool:
         """Returns True if the cache should use local metadata mode, based off env variables."""
         return (
@@ -373,6 +472,8 @@ class JumpStartModelsCache:
         """
         if self._is_local_metadata_mode():
             file_content, etag = self._get_json_file_from_local_override(key, filetype), None
+        elif self._disk_cache_dir:
+            file_content, etag = self._get_json_file_from_disk_cache_or_s3(key)
         else:
             file_content, etag = self._get_json_file_and_etag_from_s3(key)
         return file_content, etag
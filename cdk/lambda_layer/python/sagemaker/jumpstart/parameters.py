@@ -18,3 +18,4 @@ JUMPSTART_DEFAULT_MAX_S3_CACHE_ITEMS = 20
 JUMPSTART_DEFAULT_MAX_SEMANTIC_VERSION_CACHE_ITEMS = 20
 JUMPSTART_DEFAULT_S3_CACHE_EXPIRATION_HORIZON = datetime.timedelta(hours=6)
 JUMPSTART_DEFAULT_SEMANTIC_VERSION_CACHE_EXPIRATION_HORIZON = datetime.timedelta(hours=6)
+JUMPSTART_DEFAULT_DISK_CACHE_EXPIRATION_HORIZON = datetime.timedelta(hours=6)
@@ -13,6 +13,7 @@
 """Placeholder docstring"""
 from __future__ import absolute_import
 
+import collections
 import enum
 import datetime
 import json
@@ -20,6 +21,7 @@ import logging
 import os
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 from copy import deepcopy
 from botocore.exceptions import ClientError
@@ -340,8 +342,7 @@ class _LocalTransformJob(object):
         response, code = _perform_request(endpoint_url)
         if code == 200:
             execution_parameters = json.loads(response.data.decode("utf-8"))
-            # MaxConcurrentTransforms is ignored because we currently only support 1
-            for setting in ("BatchStrategy", "MaxPayloadInMB"):
+            for setting in ("BatchStrategy", "MaxPayloadInMB", "MaxConcurrentTransforms"):
                 if setting not in kwargs and setting in execution_parameters:
                     kwargs[setting] = execution_parameters[setting]
 
@@ -419,13 +420,9 @@ class _LocalTransformJob(object):
                 raise ValueError("Invalid BatchStrategy, must be 'SingleRecord' or 'MultiRecord'")
             environment["SAGEMAKER_BATCH_STRATEGY"] = strategy_env_value
 
-        # we only do 1 max concurrent transform in Local Mode
-        if "MaxConcurrentTransforms" in kwargs and int(kwargs["MaxConcurrentTransforms"]) > 1:
-            logger.warning(
-                "Local Mode only supports 1 ConcurrentTransform. Setting MaxConcurrentTransforms "
-                "to 1"
-            )
-        environment["SAGEMAKER_MAX_CONCURRENT_TRANSFORMS"] = "1"
+        environment["SAGEMAKER_MAX_CONCURRENT_TRANSFORMS"] = str(
+            kwargs.get("MaxConcurrentTransforms", 1)
+        )
 
         # if there were environment variables passed to the Transformer we will pass them to the
         # container as well.
@@ -451,6 +448,9 @@ class _LocalTransformJob(object):
         if "MaxPayloadInMB" not in kwargs:
             defaults["MaxPayloadInMB"] = 6
 
+        if "MaxConcurrentTransforms" not in kwargs:
+            defaults["MaxConcurrentTransforms"] = 1
+
         return defaults
 
     def _get_working_directory(self):
@@ -492,6 +492,11 @@ class _LocalTransformJob(object):
         (Line, RecordIO, None), and finally, it batch them according to the batch
         strategy and limit the request size.
 
+        Up to ``MaxConcurrentTransforms`` requests are sent to the container at a
+        time. Batches of consecutive files share the same pool, so a file does not
+        wait for the previous one to finish, and each output file is assembled in
+        the order of its input batches.
+
         Args:
             input_data: Input data source.
             output_data: Output data source.
@@ -499,37 +504,73 @@ class _LocalTransformJob(object):
         """
         batch_strategy = kwargs["BatchStrategy"]
         max_payload = int(kwargs["MaxPayloadInMB"])
+        max_concurrent_transforms = max(int(kwargs.get("MaxConcurrentTransforms", 1)), 1)
         data_source, batch_provider = self._prepare_data_transformation(input_data, batch_strategy)
 
         # Output settings
         accept = output_data["Accept"] if "Accept" in output_data else None
+        assemble_with_line = output_data.get("AssembleWith") == "Line"
 
         working_dir = self._get_working_directory()
         dataset_dir = data_source.get_root_dir()
 
-        for fn in data_source.get_file_list():
+        # (output file, future) pairs in submission order. A None future marks the
+        # end of a file. Requests ahead of the oldest unwritten one are bounded so
+        # that responses don't pile up in memory behind a slow batch.
+        pending = collections.deque()
+        max_pending = 2 * max_concurrent_transforms
+        output_files = []
+        with ThreadPoolExecutor(max_workers=max_concurrent_transforms) as executor:
+            try:
+                for fn in data_source.get_file_list():
+
+                    relative_path = os.path.dirname(os.path.relpath(fn, dataset_dir))
+                    filename = os.path.basename(fn)
+                    copy_directory_structure(working_dir, relative_path)
+                    destination_path = os.path.join(working_dir, relative_path, filename + ".out")
+
+                    f = open(destination_path, "wb")
+                    output_files.append(f)
+                    for item in batch_provider.pad(fn, max_payload):
+                        future = executor.submit(
+                            self._invoke_batch, item, input_data["ContentType"], accept
+                        )
+                        pending.append((f, future))
+                        _write_completed_batches(pending, max_pending, assemble_with_line)
+                    pending.append((f, None))
+                    _write_completed_batches(pending, max_pending, assemble_with_line)
+
+                _write_completed_batches(pending, 0, assemble_with_line)
+            finally:
+                for _, future in pending:
+                    if future is not None:
+                        future.cancel()
+                for f in output_files:
+                    f.close()
 
-            relative_path = os.path.dirname(os.path.relpath(fn, dataset_dir))
-            filename = os.path.basename(fn)
-            copy_directory_structure(working_dir, relative_path)
-            destination_path = os.path.join(working_dir, relative_path, filename + ".out")
+        move_to_destination(working_dir, output_data["S3OutputPath"], self.name, self.local_session)
+        self.container.stop_serving()
 
-            with open(destination_path, "wb") as f:
-                for item in batch_provider.pad(fn, max_payload):
-                    # call the container and add the result to inference.
-                    response = self.local_session.sagemaker_runtime_client.invoke_endpoint(
-                        item, "", input_data["ContentType"], accept
-                    )
+    def _invoke_batch(self, item, content_type, accept):
+        """Send one batch to the serving container and return the response body.
 
-                    response_body = response["Body"]
-                    data = response_body.read()
-                    response_body.close()
-                    f.write(data)
-                    if "AssembleWith" in output_data and output_data["AssembleWith"] == "Line":
-                        f.write(b"\n")
+        Args:
+            item: Request payload.
+            content_type: MIME type of the payload.
+            accept: Desired MIME type of the response.
 
-        move_to_destination(working_dir, output_data["S3OutputPath"], self.name, self.local_session)
-        self.container.stop_serving()
+        Returns:
+            bytes: the response body.
+        """
+        # call the container and add the result to inference.
+        response = self.local_session.sagemaker_runtime_client.invoke_endpoint(
+            item, "", content_type, accept
+        )
+
+        response_body = response["Body"]
+        data = response_body.read()
+        response_body.close()
+        return data
 
 
 class _LocalModel(object):
@@ -981,6 +1022,31 @@ class _LocalExecutionStatus(enum.Enum):
     FAILED = "Failed"
 
 
+def _write_completed_batches(pending, max_pending, assemble_with_line):
+    """Write finished batch responses to their output files in submission order.
+
+    Responses are popped from the head of ``pending`` while they are complete. If
+    more than ``max_pending`` entries are queued, this blocks on the oldest one.
+
+    Args:
+        pending (collections.deque): (output file, future) pairs, where a None future
+            marks the end of the file.
+        max_pending (int): Number of entries that may remain queued.
+        assemble_with_line (bool): Whether to append a newline after each response.
+    """
+    while pending:
+        f, future = pending[0]
+        if future is not None and len(pending) <= max_pending and not future.done():
+            return
+        pending.popleft()
+        if future is None:
+            f.close()
+            continue
+        f.write(future.result())
+        if assemble_with_line:
+            f.write(b"\n")
+
+
 def _wait_for_serving_container(serving_port):
     """Placeholder docstring."""
     i = 0
@@ -12,14 +12,12 @@
 # language governing permissions and limitations under the License.
 """Placeholder docstring"""
 from __future__ import absolute_import
-import threading
-import time
 import uuid
-from botocore.exceptions import WaiterError
 
 from sagemaker import s3
 from sagemaker.exceptions import PollingTimeoutError, AsyncInferenceModelError
 from sagemaker.async_inference import WaiterConfig, AsyncInferenceResponse
+from sagemaker.async_inference.completion_tracker import get_completion_tracker
 from sagemaker.s3 import parse_s3_url
 from sagemaker.session import Session
 from sagemaker.utils import name_from_base, sagemaker_timestamp, format_tags
@@ -231,16 +229,13 @@ class AsyncPredictor:
         Periodically check Amazon S3 output path for async inference result.
         Timeout automatically after max attempts reached
         """
-        bucket, key = parse_s3_url(output_path)
-        s3_waiter = self.s3_client.get_waiter("object_exists")
-        try:
-            s3_waiter.wait(Bucket=bucket, Key=key, WaiterConfig=waiter_config._to_request_dict())
-        except WaiterError:
+        if self._wait_for_any_object([output_path], waiter_config) is None:
             raise PollingTimeoutError(
                 message="Inference could still be running",
                 output_path=output_path,
                 seconds=waiter_config.delay * waiter_config.max_attempts,
             )
+        bucket, key = parse_s3_url(output_path)
         s3_object = self.s3_client.get_object(Bucket=bucket, Key=key)
         result = self.predictor._handle_response(response=s3_object)
         return result
@@ -249,8 +244,8 @@ class AsyncPredictor:
         """Check the Amazon S3 output path for the output.
 
         This method waits for either the output file or the failure file to be found on the
-        specified S3 output path. Whichever file is found first, its corresponding event is
-        triggered, and the method executes the appropriate action based on the event.
+        specified S3 output path, and executes the appropriate action for whichever is found
+        first.
 
         Args:
             output_path (str): The S3 path where the output file is expected to be found.
@@ -263,65 +258,45 @@ class AsyncPredictor:
 
         Raises:
             AsyncInferenceModelError: If the failure file is found before the output file.
-            PollingTimeoutError: If both files are not found and the S3 waiter
-             has thrown a WaiterError.
+            PollingTimeoutError: If neither file is found within the waiter's max attempts.
         """
-        output_bucket, output_key = parse_s3_url(output_path)
-        failure_bucket, failure_key = parse_s3_url(failure_path)
-
-        output_file_found = threading.Event()
-        failure_file_found = threading.Event()
-
-        def check_output_file():
-            try:
-                output_file_waiter = self.s3_client.get_waiter("object_exists")
-                output_file_waiter.wait(
-                    Bucket=output_bucket,
-                    Key=output_key,
-                    WaiterConfig=waiter_config._to_request_dict(),
-                )
-                output_file_found.set()
-            except WaiterError:
-                pass
-
-        def check_failure_file():
-            try:
-                failure_file_waiter = self.s3_client.get_waiter("object_exists")
-                failure_file_waiter.wait(
-                    Bucket=failure_bucket,
-                    Key=failure_key,
-                    WaiterConfig=waiter_config._to_request_dict(),
-                )
-                failure_file_found.set()
-            except WaiterError:
-                pass
-
-        output_thread = threading.Thread(target=check_output_file)
-        failure_thread = threading.Thread(target=check_failure_file)
-
-        output_thread.start()
-        failure_thread.start()
-
-        while not output_file_found.is_set() and not failure_file_found.is_set():
-            time.sleep(1)
-
-        if output_file_found.is_set():
+        found_path = self._wait_for_any_object([output_path, failure_path], waiter_config)
+
+        if found_path == output_path:
+            output_bucket, output_key = parse_s3_url(output_path)
             s3_object = self.s3_client.get_object(Bucket=output_bucket, Key=output_key)
             result = self.predictor._handle_response(response=s3_object)
             return result
 
-        failure_object = self.s3_client.get_object(Bucket=failure_bucket, Key=failure_key)
-        failure_response = self.predictor._handle_response(response=failure_object)
+        if found_path == failure_path:
+            failure_bucket, failure_key = parse_s3_url(failure_path)
+            failure_object = self.s3_client.get_object(Bucket=failure_bucket, Key=failure_key)
+            failure_response = self.predictor._handle_response(response=failure_object)
+            raise AsyncInferenceModelError(message=failure_response)
 
-        raise (
-            AsyncInferenceModelError(message=failure_response)
-            if failure_file_found.is_set()
-            else PollingTimeoutError(
-                message="Inference could still be running",
-                output_path=output_path,
-                seconds=waiter_config.delay * waiter_config.max_attempts,
-            )
+        raise PollingTimeoutError(
+            message="Inference could still be running",
+            output_path=output_path,
+            seconds=waiter_config.delay * waiter_config.max_attempts,
+        )
+
+    def _wait_for_any_object(self, s3_paths, waiter_config):
+        """Wait until any of ``s3_paths`` exists.
+
+        The paths are checked by the process-wide completion tracker, which polls all
+        outstanding async inferences from a single thread.
+
+        Returns:
+            str: The first path found to exist, or None if none did within the waiter's
+                max attempts.
+        """
+        future = get_completion_tracker().watch(
+            self.s3_client,
+            s3_paths,
+            delay=waiter_config.delay,
+            timeout=waiter_config.delay * waiter_config.max_attempts,
         )
+        return future.result()
 
     def update_endpoint(
         self,
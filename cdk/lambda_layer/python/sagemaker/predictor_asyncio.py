@@ -0,0 +1,338 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""An asyncio interface for making prediction requests to an Amazon SageMaker endpoint."""
+from __future__ import absolute_import
+
+import asyncio
+import io
+import json
+import random
+from typing import Optional
+
+import botocore.auth
+import botocore.awsrequest
+import botocore.eventstream
+import botocore.exceptions
+import botocore.parsers
+import botocore.serialize
+
+from sagemaker.base_predictor import DEFAULT_BATCH_MAX_RETRIES, _RETRYABLE_ERROR_CODES
+from sagemaker.iterators import AsyncByteIterator
+from sagemaker.utils import DeferredError
+
+try:
+    import aiohttp
+except ImportError as e:
+    aiohttp = DeferredError(e)
+
+DEFAULT_MAX_CONNECTIONS = 100
+# Same read timeout as the session's SageMaker Runtime client.
+DEFAULT_READ_TIMEOUT = 80
+
+
+class AsyncioPredictor:
+    """Make prediction requests to an Amazon SageMaker endpoint from an asyncio event loop.
+
+    Requests are built and signed with botocore and sent with ``aiohttp``, so an
+    in-flight request holds a connection but not a thread. The number of open
+    connections is capped by ``max_connections``; requests beyond it wait for a
+    free connection.
+
+    Example::
+
+        async with AsyncioPredictor(predictor) as async_predictor:
+            results = await asyncio.gather(*(async_predictor.predict(row) for row in rows))
+    """
+
+    def __init__(
+        self,
+        predictor,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+        max_retries: int = DEFAULT_BATCH_MAX_RETRIES,
+    ):
+        """Initialize an ``AsyncioPredictor``.
+
+        Args:
+            predictor (sagemaker.predictor.Predictor): The ``Predictor`` whose endpoint,
+                session, serializer and deserializer are used.
+            max_connections (int): Most connections open to the endpoint at a time
+                (Default: 100).
+            read_timeout (float): Seconds to wait for data from the endpoint before
+                failing a request. None disables the timeout (Default: 80).
+            max_retries (int): Retries of a throttled request before giving up
+                (Default: 5).
+        """
+        runtime_client = predictor.sagemaker_session.sagemaker_runtime_client
+        if getattr(runtime_client, "meta", None) is None:
+            raise ValueError(
+                "AsyncioPredictor requires a botocore SageMaker Runtime client. "
+                "Local mode is not supported."
+            )
+
+        self.predictor = predictor
+        self.endpoint_name = predictor.endpoint_name
+        self.sagemaker_session = predictor.sagemaker_session
+        self.serializer = predictor.serializer
+        self.deserializer = predictor.deserializer
+        self.max_connections = max_connections
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self._runtime_client = runtime_client
+        self._http_session = None
+        self._http_session_loop = None
+
+    async def __aenter__(self):
+        """Return this predictor for use as an asynchronous context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close the connections to the endpoint."""
+        await self.close()
+
+    async def close(self):
+        """Close the connections to the endpoint."""
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
+    async def predict(
+        self,
+        data,
+        initial_args=None,
+        target_model=None,
+        target_variant=None,
+        inference_id=None,
+        custom_attributes=None,
+        component_name: Optional[str] = None,
+    ):
+        """Return the inference from the specified endpoint.
+
+        Takes the same arguments and returns the same result as
+        :meth:`~sagemaker.predictor.Predictor.predict`.
+
+        Args:
+            data (object): Input data for which you want the model to provide
+                inference. If a serializer was specified when creating the
+                Predictor, the result of the serializer is sent as input
+                data. Otherwise the data must be sequence of bytes, and the
+                predict method then sends the bytes in the request body as is.
+            initial_args (dict[str,str]): Optional. Default arguments for the
+                ``InvokeEndpoint`` request. Default is None (no default arguments).
+            target_model (str): S3 model artifact path to run an inference request on,
+                in case of a multi model endpoint (Default: None).
+            target_variant (str): The name of the production variant to run an inference
+                request on (Default: None).
+            inference_id (str): If you provide a value, it is added to the captured data
+                when you enable data capture on the endpoint (Default: None).
+            custom_attributes (str): Provides additional information about a request for an
+                inference submitted to a model hosted at an Amazon SageMaker endpoint
+                (Default: None).
+            component_name (str): Optional. Name of the Amazon SageMaker inference component
+                corresponding the predictor.
+
+        Returns:
+            object: Inference for the given input, decoded by the predictor's deserializer.
+        """
+        request_args = self.predictor._create_request_args(
+            data=data,
+            initial_args=initial_args,
+            target_model=target_model,
+            target_variant=target_variant,
+            inference_id=inference_id,
+            custom_attributes=custom_attributes,
+        )
+        inference_component_name = component_name or self.predictor._get_component_name()
+        if inference_component_name:
+            request_args["InferenceComponentName"] = inference_component_name
+
+        response = await self._send("InvokeEndpoint", request_args)
+        try:
+            body = await response.read()
+        finally:
+            response.release()
+        content_type = response.headers.get("Content-Type", "application/octet-stream")
+        return self.deserializer.deserialize(io.BytesIO(body), content_type)
+
+    async def predict_stream(
+        self,
+        data,
+        initial_args=None,
+        target_variant=None,
+        inference_id=None,
+        custom_attributes=None,
+        component_name: Optional[str] = None,
+        target_container_hostname=None,
+        iterator=AsyncByteIterator,
+    ):
+        """Return an asynchronous iterator over the streamed inference of the endpoint.
+
+        Takes the same arguments as :meth:`~sagemaker.predictor.Predictor.predict_stream`.
+        The connection is returned to the pool once the stream is exhausted.
+
+        Args:
+            data (object): Input data for which you want the model to provide
+                inference, encoded by the predictor's serializer.
+            initial_args (dict[str,str]): Optional. Default arguments for the
+                ``InvokeEndpointWithResponseStream`` request (Default: None).
+            target_variant (str): Optional. The name of the production variant to run an
+                inference request on (Default: None).
+            inference_id (str): Optional. If you provide a value, it is added to the captured
+                data when you enable data capture on the endpoint (Default: None).
+            custom_attributes (str): Optional. Provides additional information about a request
+                for an inference submitted to a model hosted at an Amazon SageMaker endpoint
+                (Default: None).
+            component_name (str): Optional. Name of the Amazon SageMaker inference component
+                corresponding the predictor. (Default: None)
+            target_container_hostname (str): Optional. If the endpoint hosts multiple containers
+                and is configured to use direct invocation, this parameter specifies the host name
+                of the container to invoke. (Default: None).
+            iterator (:class:`~sagemaker.iterators.BaseAsyncIterator`): The asynchronous
+                iterator class wrapping the event stream
+                (Default: :class:`~sagemaker.iterators.AsyncByteIterator`). Use
+                :class:`~sagemaker.iterators.AsyncLineIterator` to iterate over lines.
+
+        Returns:
+            object (:class:`~sagemaker.iterators.BaseAsyncIterator`): An instance of
+            ``iterator`` over the event stream of the response.
+        """
+        request_args = self.predictor._create_request_args(
+            data=data,
+            initial_args=initial_args,
+            target_variant=target_variant,
+            inference_id=inference_id,
+            custom_attributes=custom_attributes,
+            target_container_hostname=target_container_hostname,
+        )
+        inference_component_name = component_name or self.predictor._get_component_name()
+        if inference_component_name:
+            request_args["InferenceComponentName"] = inference_component_name
+
+        response = await self._send("InvokeEndpointWithResponseStream", request_args)
+        return iterator(self._event_stream(response))
+
+    async def _get_http_session(self):
+        """Return the ``aiohttp`` session of the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._http_session is None
+            or self._http_session.closed
+            or self._http_session_loop is not loop
+        ):
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=self.read_timeout),
+            )
+            self._http_session_loop = loop
+        return self._http_session
+
+    def _sign_request(self, operation_name, request_args):
+        """Serialize ``request_args`` for a SageMaker Runtime operation and sign it with SigV4.
+
+        Returns:
+            botocore.awsrequest.AWSPreparedRequest: the signed request.
+        """
+        meta = self._runtime_client.meta
+        service_model = meta.service_model
+        operation_model = service_model.operation_model(operation_name)
+        request_dict = botocore.serialize.create_serializer(
+            service_model.protocol
+        ).serialize_to_request(request_args, operation_model)
+        botocore.awsrequest.prepare_request_dict(request_dict, meta.endpoint_url)
+        request = botocore.awsrequest.create_request_object(request_dict)
+
+        credentials = self.sagemaker_session.boto_session.get_credentials()
+        if credentials is None:
+            raise botocore.exceptions.NoCredentialsError()
+        botocore.auth.SigV4Auth(
+            credentials.get_frozen_credentials(), service_model.signing_name, meta.region_name
+        ).add_auth(request)
+        return request.prepare()
+
+    async def _send(self, operation_name, request_args):
+        """Send a signed request, retrying throttled attempts with backoff and jitter.
+
+        Returns:
+            aiohttp.ClientResponse: the successful response, with its body unread.
+
+        Raises:
+            botocore.exceptions.ClientError: If the endpoint returns an error. The modeled
+                exception class of the runtime client is used when there is one, such as
+                ``ModelError``.
+        """
+        http_session = await self._get_http_session()
+        attempt = 0
+        while True:
+            request = self._sign_request(operation_name, request_args)
+            response = await http_session.request(
+                request.method, request.url, headers=dict(request.headers), data=request.body
+            )
+            if response.status < 300:
+                return response
+
+            try:
+                body = await response.read()
+            finally:
+                response.release()
+            error = self._client_error(operation_name, response.status, response.headers, body)
+            if error.response["Error"]["Code"] not in _RETRYABLE_ERROR_CODES or (
+                attempt == self.max_retries
+            ):
+                raise error
+            await asyncio.sleep(random.uniform(0, 0.1 * 2**attempt))
+            attempt += 1
+
+    def _client_error(self, operation_name, status, headers, body):
+        """Build the exception botocore would raise for an error response."""
+        meta = self._runtime_client.meta
+        parsed = botocore.parsers.create_parser(meta.service_model.protocol).parse(
+            {
+                "headers": {key.lower(): value for key, value in headers.items()},
+                "status_code": status,
+                "body": body,
+            },
+            meta.service_model.operation_model(operation_name).output_shape,
+        )
+        error_class = self._runtime_client.exceptions.from_code(parsed["Error"]["Code"])
+        return error_class(parsed, operation_name)
+
+    async def _event_stream(self, response):
+        """Yield the chunks of an event stream response, shaped like botocore's.
+
+        Each chunk is a dict such as ``{"PayloadPart": {"Bytes": b"..."}}`` or
+        ``{"ModelStreamError": {"Message": ..., "ErrorCode": ...}}``, which is what the
+        iterators in :mod:`sagemaker.iterators` expect.
+        """
+        event_buffer = botocore.eventstream.EventStreamBuffer()
+        try:
+            async for data in response.content.iter_any():
+                event_buffer.add_data(data)
+                for message in event_buffer:
+                    headers = message.headers
+                    message_type = headers.get(":message-type")
+                    if message_type == "event":
+                        yield {headers.get(":event-type"): {"Bytes": message.payload}}
+                    elif message_type == "exception":
+                        yield {headers.get(":exception-type"): json.loads(message.payload)}
+                    else:
+                        raise botocore.exceptions.ClientError(
+                            {
+                                "Error": {
+                                    "Code": headers.get(":error-code"),
+                                    "Message": headers.get(":error-message"),
+                                }
+                            },
+                            "InvokeEndpointWithResponseStream",
+                        )
+        finally:
+            response.release()
@@ -18,7 +18,12 @@ functions that were originally in `s3.py` so that those functions could be impor
 """
 from __future__ import print_function, absolute_import
 
+import hashlib
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
 from typing import Optional
 
@@ -26,6 +31,11 @@ from six.moves.urllib.parse import urlparse
 
 logger = logging.getLogger("sagemaker")
 
+# boto3's default multipart_chunksize, used to recompute multipart ETags of local files
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+# Bytes read at a time when hashing a local file
+_HASH_BLOCK_SIZE = 1024 * 1024
+
 
 def parse_s3_url(url):
     """Returns an (s3 bucket, key name/prefix) tuple from a url with an s3 scheme.
@@ -173,3 +183,226 @@ def determine_bucket_and_prefix(
     # once in total.
 
     return final_bucket, final_key_prefix
+
+
+class _AggregatedProgressCallback(object):
+    """Funnels progress callbacks from concurrent transfers into a single callback.
+
+    boto3 invokes ``Callback`` from its own transfer threads, so with several files in
+    flight the user callback would otherwise be called concurrently.
+    """
+
+    def __init__(self, callback=None):
+        """Initialize the aggregator.
+
+        Args:
+            callback (callable): Optional callback invoked with the number of bytes
+                transferred by each progress event, as with boto3's ``Callback``.
+        """
+        self._callback = callback
+        self._lock = threading.Lock()
+        self.bytes_transferred = 0
+
+    def __call__(self, bytes_amount):
+        """Record a progress event and forward it to the wrapped callback."""
+        with self._lock:
+            self.bytes_transferred += bytes_amount
+            if self._callback is not None:
+                self._callback(bytes_amount)
+
+
+def upload_files(
+    s3_resource,
+    bucket,
+    files,
+    callback=None,
+    extra_args=None,
+    max_workers=None,
+    transfer_config=None,
+):
+    """Upload local files to S3, optionally on a bounded pool of threads.
+
+    Args:
+        s3_resource (boto3.resource): S3 resource to upload with.
+        bucket (str): Name of the S3 bucket to upload to.
+        files (list[tuple[str, str]]): ``(local_path, s3_key)`` pairs to upload.
+        callback (callable): Optional progress callback, as in boto3's ``upload_file``.
+            With concurrent uploads it is never invoked from two threads at once.
+        extra_args (dict): Optional ExtraArgs passed to every upload.
+        max_workers (int): Number of files uploaded concurrently. Files are uploaded one
+            at a time if this is None or 1 (default: None).
+        transfer_config (boto3.s3.transfer.TransferConfig): Optional transfer configuration
+            (multipart threshold, chunk size, per-file concurrency) shared by every upload.
+
+    Returns:
+        list[dict]: Upload manifest with one entry per file, in the order of ``files``.
+            Each entry holds the ``LocalPath``, the ``S3Uri`` and the ``Size`` in bytes.
+    """
+    transfer_kwargs = {"ExtraArgs": extra_args}
+    if transfer_config is not None:
+        transfer_kwargs["Config"] = transfer_config
+
+    def _manifest_entry(local_path, s3_key):
+        return {
+            "LocalPath": local_path,
+            "S3Uri": "s3://{}/{}".format(bucket, s3_key),
+            "Size": os.path.getsize(local_path),
+        }
+
+    if not max_workers or max_workers <= 1 or len(files) <= 1:
+        manifest = []
+        for local_path, s3_key in files:
+            s3_resource.Object(bucket, s3_key).upload_file(
+                local_path, Callback=callback, **transfer_kwargs
+            )
+            manifest.append(_manifest_entry(local_path, s3_key))
+        return manifest
+
+    # Resources are not thread-safe, but their underlying client is.
+    client = s3_resource.meta.client
+    progress = _AggregatedProgressCallback(callback)
+
+    def _upload(file_pair):
+        local_path, s3_key = file_pair
+        client.upload_file(local_path, bucket, s3_key, Callback=progress, **transfer_kwargs)
+        return _manifest_entry(local_path, s3_key)
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+        manifest = list(executor.map(_upload, files))
+    elapsed = max(time.time() - start, 1e-6)
+
+    logger.info(
+        "Uploaded %d files (%d bytes) to s3://%s in %.2fs (%.2f MB/s) with %d workers.",
+        len(manifest),
+        progress.bytes_transferred,
+        bucket,
+        elapsed,
+        progress.bytes_transferred / elapsed / 1e6,
+        min(max_workers, len(files)),
+    )
+    return manifest
+
+
+def local_file_matches(local_path, size, etag, multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE):
+    """Check whether a local file has the size and ETag of an S3 object.
+
+    Single-part ETags are the MD5 of the object. Multipart ETags (``<md5>-<parts>``) are the
+    MD5 of the concatenated part digests, which can only be reproduced if the object was
+    uploaded with ``multipart_chunksize`` parts. Any other ETag (for example of objects
+    encrypted with SSE-KMS or SSE-C) never matches, so the object is downloaded again.
+
+    Args:
+        local_path (str): Path of the local file.
+        size (int): Size of the S3 object in bytes.
+        etag (str): ETag of the S3 object, with or without surrounding quotes.
+        multipart_chunksize (int): Part size assumed for multipart ETags
+            (default: boto3's 8 MiB).
+
+    Returns:
+        bool: True if the local file exists and matches the object.
+    """
+    if not etag or not os.path.isfile(local_path) or os.path.getsize(local_path) != size:
+        return False
+
+    etag = etag.strip('"')
+    digest, _, parts = etag.partition("-")
+    # A single-part ETag covers the whole file as one part
+    part_size = multipart_chunksize if parts else max(size, 1)
+    part_digests = []
+    with open(local_path, "rb") as f:
+        for part_start in range(0, size, part_size):
+            part_hash = hashlib.md5()
+            remaining = min(part_size, size - part_start)
+            # Parts are hashed a block at a time, so memory use doesn't grow with the file
+            while remaining:
+                block = f.read(min(_HASH_BLOCK_SIZE, remaining))
+                if not block:
+                    break
+                part_hash.update(block)
+                remaining -= len(block)
+            part_digests.append(part_hash.digest())
+
+    if not parts:
+        return digest == (part_digests[0].hex() if part_digests else hashlib.md5().hexdigest())
+    return len(part_digests) == int(parts) and digest == hashlib.md5(b"".join(part_digests)).hexdigest()
+
+
+def download_files(
+    s3_client,
+    bucket,
+    objects,
+    extra_args=None,
+    max_workers=None,
+    transfer_config=None,
+):
+    """Download S3 objects to local paths, optionally on a bounded pool of threads.
+
+    Objects whose local copy already matches their size and ETag are skipped.
+
+    Args:
+        s3_client (boto3.client): S3 client to download with.
+        bucket (str): Name of the S3 bucket to download from.
+        objects (list[dict]): Objects to download, each with the ``Key``, ``Size`` and ``ETag``
+            of the S3 object (as returned by ``list_objects_v2``) and the ``LocalPath`` to
+            download it to.
+        extra_args (dict): Optional ExtraArgs passed to every download.
+        max_workers (int): Number of objects downloaded concurrently. Objects are downloaded
+            one at a time if this is None or 1 (default: None).
+        transfer_config (boto3.s3.transfer.TransferConfig): Optional transfer configuration
+            shared by every download.
+
+    Returns:
+        list[dict]: Download manifest with one entry per object, in the order of ``objects``.
+            Each entry holds the ``S3Uri``, the ``LocalPath``, the ``Size`` in bytes and
+            whether the download was ``Skipped``.
+    """
+    transfer_kwargs = {"ExtraArgs": extra_args}
+    if transfer_config is not None:
+        transfer_kwargs["Config"] = transfer_config
+    multipart_chunksize = getattr(
+        transfer_config, "multipart_chunksize", DEFAULT_MULTIPART_CHUNKSIZE
+    )
+
+    def _download(s3_object):
+        local_path = s3_object["LocalPath"]
+        skipped = local_file_matches(
+            local_path, s3_object.get("Size"), s3_object.get("ETag"), multipart_chunksize
+        )
+        if not skipped:
+            local_dir = os.path.dirname(local_path)
+            if local_dir:
+                os.makedirs(local_dir, exist_ok=True)
+            s3_client.download_file(
+                Bucket=bucket, Key=s3_object["Key"], Filename=local_path, **transfer_kwargs
+            )
+        return {
+            "S3Uri": "s3://{}/{}".format(bucket, s3_object["Key"]),
+            "LocalPath": local_path,
+            "Size": s3_object.get("Size"),
+            "Skipped": skipped,
+        }
+
+    workers = min(max_workers or 1, len(objects))
+    start = time.time()
+    if workers <= 1:
+        manifest = [_download(s3_object) for s3_object in objects]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            manifest = list(executor.map(_download, objects))
+    elapsed = max(time.time() - start, 1e-6)
+
+    downloaded = [entry for entry in manifest if not entry["Skipped"]]
+    bytes_downloaded = sum(entry["Size"] or 0 for entry in downloaded)
+    logger.info(
+        "Downloaded %d objects (%d bytes) from s3://%s in %.2fs (%.2f MB/s) with %d workers, "
+        "%d already up to date.",
+        len(downloaded),
+        bytes_downloaded,
+        bucket,
+        elapsed,
+        bytes_downloaded / elapsed / 1e6,
+        max(workers, 1),
+        len(manifest) - len(downloaded),
+    )
+    return manifest
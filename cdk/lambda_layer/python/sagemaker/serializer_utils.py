@@ -14,6 +14,9 @@
 from __future__ import absolute_import
 
 import logging
+import mmap
+import os
+import stat
 import struct
 import sys
 
@@ -87,6 +90,21 @@ def write_numpy_to_dense_tensor(file, array, labels=None):
         resolved_label_type = _resolve_type(labels.dtype)
     resolved_type = _resolve_type(array.dtype)
 
+    if array.shape[1] and (labels is None or labels.shape[0] >= array.shape[0]):
+        label_type = resolved_label_type if labels is not None else None
+        if labels is not None:
+            # the per-row loop ignores labels past the last row
+            labels = labels[: array.shape[0]]
+        step = max(1, _ENCODE_CHUNK_BYTES // (array.shape[1] * _MAX_VALUE_BYTES[resolved_type]))
+        for start in range(0, array.shape[0], step):
+            chunk_labels = labels[start : start + step] if labels is not None else None
+            file.write(
+                _encode_dense_records(
+                    array[start : start + step], resolved_type, chunk_labels, label_type
+                )
+            )
+        return
+
     # Write each vector in array into a Record in the file object
     record = Record()
     for index, vector in enumerate(array):
@@ -97,6 +115,180 @@ def write_numpy_to_dense_tensor(file, array, labels=None):
         _write_recordio(file, record.SerializeToString())
 
 
+# Rows are encoded in chunks of about this many bytes of tensor values, which bounds the
+# memory used for the intermediate byte matrices.
+_ENCODE_CHUNK_BYTES = 16 * 1024 * 1024
+
+# Largest encoded size of a single tensor value: int32 values are varints that take up to
+# 10 bytes when negative.
+_MAX_VALUE_BYTES = {"Int32": 10, "Float64": 8, "Float32": 4}
+
+# Field tags of the tensor inside a ``Value`` message, by resolved type
+_VALUE_TENSOR_TAGS = {"Float32": 0x12, "Float64": 0x1A, "Int32": 0x3A}
+
+# Tag and length-delimited "values" key of a map entry, followed by the tag of its value
+_VALUES_ENTRY_KEY = b"\x0a\x06values\x12"
+
+
+def _encode_varints(values):
+    """Encode integers as protobuf varints.
+
+    Args:
+        values (numpy.array): 1-D array of integers. Negative values are encoded as 64-bit
+            two's complement, like protobuf does for int32 fields.
+
+    Returns:
+        tuple[numpy.array, numpy.array]: A ``(len(values), width)`` uint8 array holding the
+            varint of each value left-aligned in its row, and the length of each varint.
+    """
+    unsigned = np.asarray(values).astype(np.int64).view(np.uint64)
+    lengths = np.ones(len(unsigned), dtype=np.int64)
+    for i in range(1, 10):
+        lengths += (unsigned >> np.uint64(7 * i)) != 0
+
+    width = int(lengths.max()) if len(lengths) else 1
+    encoded = np.empty((len(unsigned), width), dtype=np.uint8)
+    for i in range(width):
+        encoded[:, i] = (unsigned >> np.uint64(7 * i)) & np.uint64(0x7F)
+    encoded[np.arange(width) < (lengths[:, None] - 1)] |= 0x80
+    return encoded, lengths
+
+
+def _varint_segment(values):
+    """Encode one varint per row as a segment for ``_join_segments``.
+
+    Returns:
+        tuple[tuple, numpy.array]: The segment and the length of each varint.
+    """
+    encoded, lengths = _encode_varints(values)
+    if len(lengths) and (lengths == lengths[0]).all():
+        return (encoded, None), lengths
+    return (encoded, np.arange(encoded.shape[1]) < lengths[:, None]), lengths
+
+
+def _constant_segment(data, n_rows):
+    """Repeat the same bytes on every row as a segment for ``_join_segments``."""
+    encoded = np.broadcast_to(np.frombuffer(data, dtype=np.uint8), (n_rows, len(data)))
+    return encoded, None
+
+
+def _join_segments(segments):
+    """Concatenate per-row byte segments, row by row, into a single bytes object.
+
+    Each segment is a ``(bytes, mask)`` pair of ``(n_rows, width)`` arrays, where the mask
+    selects the bytes of each row that are actually part of the output (None keeps them all).
+    """
+    data = np.concatenate([segment[0] for segment in segments], axis=1)
+    if all(segment[1] is None for segment in segments):
+        return data.tobytes()
+    mask = np.concatenate(
+        [
+            np.ones(segment[0].shape, dtype=bool) if segment[1] is None else segment[1]
+            for segment in segments
+        ],
+        axis=1,
+    )
+    return data[mask].tobytes()
+
+
+def _tensor_value_segments(resolved_type, matrix):
+    """Encode each row of a matrix as the packed ``values`` of a ``Value`` tensor.
+
+    Returns:
+        tuple[list, numpy.array]: The segments of the serialized ``Value`` messages and the
+            length in bytes of each of them.
+    """
+    n_rows = matrix.shape[0]
+    if resolved_type == "Int32":
+        if matrix.size and (matrix.min() < -(2**31) or matrix.max() >= 2**31):
+            raise ValueError("Value out of range for Int32 tensor")
+        encoded, lengths = _encode_varints(matrix.ravel())
+        width = encoded.shape[1]
+        packed = encoded.reshape(n_rows, -1), (
+            np.arange(width) < lengths[:, None]
+        ).reshape(n_rows, -1)
+        packed_lengths = lengths.reshape(n_rows, -1).sum(axis=1)
+    else:
+        dtype = "<f4" if resolved_type == "Float32" else "<f8"
+        values = np.ascontiguousarray(matrix, dtype=dtype).view(np.uint8)
+        packed = values.reshape(n_rows, -1), None
+        packed_lengths = np.full(n_rows, values.shape[1], dtype=np.int64)
+
+    # Tensor: packed ``values`` field (1)
+    packed_length, packed_length_sizes = _varint_segment(packed_lengths)
+    tensor_lengths = 1 + packed_length_sizes + packed_lengths
+    # Value: tensor field of the resolved type
+    tensor_length, tensor_length_sizes = _varint_segment(tensor_lengths)
+    segments = [
+        _constant_segment(bytes([_VALUE_TENSOR_TAGS[resolved_type]]), n_rows),
+        tensor_length,
+        _constant_segment(b"\x0a", n_rows),
+        packed_length,
+        packed,
+    ]
+    return segments, 1 + tensor_length_sizes + tensor_lengths
+
+
+def _map_entry_segments(field_tag, resolved_type, matrix):
+    """Encode each row of a matrix as a ``{"values": Value}`` map field of a ``Record``.
+
+    Returns:
+        tuple[list, numpy.array]: The segments of the serialized fields and the length in
+            bytes of each of them.
+    """
+    n_rows = matrix.shape[0]
+    value_segments, value_lengths = _tensor_value_segments(resolved_type, matrix)
+    value_length, value_length_sizes = _varint_segment(value_lengths)
+    entry_lengths = len(_VALUES_ENTRY_KEY) + value_length_sizes + value_lengths
+    entry_length, entry_length_sizes = _varint_segment(entry_lengths)
+    segments = [
+        _constant_segment(bytes([field_tag]), n_rows),
+        entry_length,
+        _constant_segment(_VALUES_ENTRY_KEY, n_rows),
+        value_length,
+    ] + value_segments
+    return segments, 1 + entry_length_sizes + entry_lengths
+
+
+def _encode_dense_records(array, resolved_type, labels=None, resolved_label_type=None):
+    """Encode the rows of a matrix as RecordIO-framed ``Record`` protobufs in bulk.
+
+    The output is byte-identical to serializing a ``Record`` per row and writing it with
+    ``_write_recordio``, but the protobuf payloads and the RecordIO framing of all rows are
+    built with array operations instead of a Python loop.
+
+    Args:
+        array (numpy.array): Matrix with at least one column; each row becomes a Record.
+        resolved_type (str): Tensor type of the features, as returned by ``_resolve_type``.
+        labels (numpy.array): Optional vector with one label per row.
+        resolved_label_type (str): Tensor type of the labels.
+
+    Returns:
+        bytes: The encoded records.
+    """
+    n_rows = array.shape[0]
+    segments, record_lengths = _map_entry_segments(0x0A, resolved_type, array)
+    if labels is not None:
+        label_segments, label_lengths = _map_entry_segments(
+            0x12, resolved_label_type, np.asarray(labels).reshape(n_rows, 1)
+        )
+        segments += label_segments
+        record_lengths = record_lengths + label_lengths
+
+    header = np.empty((n_rows, 2), dtype=np.dtype("I"))
+    header[:, 0] = _kmagic
+    header[:, 1] = record_lengths
+    pad_lengths = -record_lengths % 4
+    segments = [(header.view(np.uint8), None)] + segments
+    if (pad_lengths == pad_lengths[0]).all():
+        segments.append((np.zeros((n_rows, pad_lengths[0]), dtype=np.uint8), None))
+    else:
+        segments.append(
+            (np.zeros((n_rows, 3), dtype=np.uint8), np.arange(3) < pad_lengths[:, None])
+        )
+    return _join_segments(segments)
+
+
 def write_spmatrix_to_sparse_tensor(file, array, labels=None):
     """Writes a scipy sparse matrix to a sparse tensor
 
@@ -161,7 +353,7 @@ def read_records(file):
         file:
     """
     records = []
-    for record_data in read_recordio(file):
+    for record_data in read_recordio_views(file):
         record = Record()
         record.ParseFromString(record_data)
         records.append(record)
@@ -197,18 +389,259 @@ def _write_recordio(f, data):
 
 
 def read_recordio(f):
-    """Placeholder Docstring"""
+    """Read the RecordIO records of a file as bytes.
+
+    Args:
+        f: Binary file object, or bytes-like object, to read the records from.
+    """
+    for record in read_recordio_views(f):
+        yield bytes(record)
+
+
+def _recordio_buffer(f):
+    """Return the remaining contents of a file as a memoryview, without copying if possible.
+
+    Regular files are memory-mapped from their current position, and left positioned at the
+    end. Other file objects are read into memory; bytes-like objects are used as they are.
+    """
+    if isinstance(f, (bytes, bytearray, memoryview)):
+        return memoryview(f)
+    try:
+        fileno = f.fileno()
+        position = f.tell()
+        status = os.fstat(fileno)
+    except (AttributeError, OSError, ValueError):
+        return memoryview(f.read())
+    if not stat.S_ISREG(status.st_mode):
+        return memoryview(f.read())
+    size = status.st_size
+    if size <= position:
+        return memoryview(b"")
+    # The mapping is released once the last memoryview into it is gone.
+    mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    f.seek(size)
+    return memoryview(mapped)[position:]
+
+
+def _recordio_spans(buffer):
+    """Find the payload offsets and lengths of all RecordIO records in a buffer.
+
+    When the records are all the same size, their boundaries are validated in bulk;
+    otherwise the headers are walked one by one.
+
+    Returns:
+        tuple[numpy.array, numpy.array]: The start offset and length of each payload.
+    """
+    size = len(buffer)
+    if size < 8:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    magic, length = struct.unpack_from("II", buffer, 0)
+    stride = 8 + (((length + 3) >> 2) << 2)
+    if magic == _kmagic and size % stride == 0:
+        headers = np.ndarray(
+            (size // stride, 2), dtype=np.dtype("I"), buffer=buffer, strides=(stride, 4)
+        )
+        if (headers[:, 0] == _kmagic).all() and (headers[:, 1] == length).all():
+            starts = np.arange(8, size, stride, dtype=np.int64)
+            return starts, np.full(len(starts), length, dtype=np.int64)
+
+    starts, lengths = [], []
+    position = 0
+    while position + 4 <= size:
+        (magic,) = struct.unpack_from("I", buffer, position)
+        if magic != _kmagic:
+            raise ValueError("Invalid RecordIO magic number at offset {}".format(position))
+        (length,) = struct.unpack_from("I", buffer, position + 4)
+        starts.append(position + 8)
+        lengths.append(min(length, size - position - 8))
+        position += 8 + (((length + 3) >> 2) << 2)
+    return np.array(starts, dtype=np.int64), np.array(lengths, dtype=np.int64)
+
+
+def read_recordio_views(f):
+    """Read the RecordIO records of a file as memoryview slices of the file contents.
+
+    Unlike ``read_recordio``, no bytes object is created per record. The views stay valid
+    after the file is closed.
+
+    Args:
+        f: Binary file object, or bytes-like object, to read the records from.
+
+    Returns:
+        generator[memoryview]: The payload of each record.
+    """
+    buffer = _recordio_buffer(f)
+    starts, lengths = _recordio_spans(buffer)
+    for start, length in zip(starts.tolist(), lengths.tolist()):
+        yield buffer[start : start + length]
+
+
+def _read_varint(buffer, position):
+    """Decode the protobuf varint at a position, returning its value and the next position."""
+    result = shift = 0
     while True:
-        try:
-            (read_kmagic,) = struct.unpack("I", f.read(4))
-        except struct.error:
-            return
-        assert read_kmagic == _kmagic
-        (len_record,) = struct.unpack("I", f.read(4))
-        pad = (((len_record + 3) >> 2) << 2) - len_record
-        yield f.read(len_record)
-        if pad:
-            f.read(pad)
+        byte = buffer[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+
+
+def _length_delimited_fields(buffer, start, end):
+    """Yield ``(field number, value start, value end)`` for the length-delimited fields."""
+    position = start
+    while position < end:
+        tag, position = _read_varint(buffer, position)
+        wire_type = tag & 0x07
+        if wire_type == 0:
+            _, position = _read_varint(buffer, position)
+        elif wire_type == 1:
+            position += 8
+        elif wire_type == 5:
+            position += 4
+        elif wire_type == 2:
+            length, position = _read_varint(buffer, position)
+            yield tag >> 3, position, position + length
+            position += length
+        else:
+            raise ValueError("Unsupported protobuf wire type {}".format(wire_type))
+
+
+# Tensor field number inside a ``Value`` message, to the numpy dtype of its packed values
+_PACKED_TENSOR_DTYPES = {2: np.dtype("<f4"), 3: np.dtype("<f8")}
+
+
+def _find_tensor(record, field_number, key):
+    """Locate the packed values of ``record.<field>[key]`` in a serialized ``Record``.
+
+    Returns:
+        tuple: The tensor field number of the ``Value`` and the start and end of its packed
+            values, or None if the record has no such tensor or it is not packed.
+    """
+    found = None
+    for number, entry_start, entry_end in _length_delimited_fields(record, 0, len(record)):
+        if number != field_number:
+            continue
+        entry_key = value = None
+        for entry_number, start, end in _length_delimited_fields(record, entry_start, entry_end):
+            if entry_number == 1:
+                entry_key = bytes(record[start:end]).decode("utf-8")
+            elif entry_number == 2:
+                value = (start, end)
+        if entry_key != key or value is None:
+            continue
+        found = None
+        for tensor_number, tensor_start, tensor_end in _length_delimited_fields(record, *value):
+            for values_number, start, end in _length_delimited_fields(
+                record, tensor_start, tensor_end
+            ):
+                if values_number == 1:
+                    found = (tensor_number, start, end)
+    return found
+
+
+def read_dense_tensors(f, field="features", key="values", out=None):
+    """Decode a dense tensor of every RecordIO ``Record`` in a file into a NumPy matrix.
+
+    Float32 and Float64 tensors are copied straight from the file contents into the matrix,
+    without creating ``Record`` objects. When all records share the same layout up to the
+    tensor, as records written by ``write_numpy_to_dense_tensor`` or returned by first-party
+    algorithms do, they are all decoded at once. Other tensors are decoded through ``Record``.
+
+    Args:
+        f: Binary file object, or bytes-like object, to read the records from.
+        field (str): ``Record`` map holding the tensor: "features" or "label"
+            (default: "features").
+        key (str): Key of the tensor in the map (default: "values").
+        out (numpy.array): Optional matrix of shape ``(number of records, tensor size)``
+            to decode into. One of the tensor's dtype is allocated if not specified.
+
+    Returns:
+        numpy.array: Matrix with one row per record.
+
+    Raises:
+        ValueError: If a record has no such tensor, or tensors differ in size.
+    """
+    field_number = {"features": 1, "label": 2}[field]
+    buffer = _recordio_buffer(f)
+    starts, lengths = _recordio_spans(buffer)
+    if not len(starts):
+        return out if out is not None else np.zeros((0, 0), dtype=np.float32)
+
+    first = buffer[starts[0] : starts[0] + lengths[0]]
+    location = _find_tensor(first, field_number, key)
+    if location is not None and location[0] in _PACKED_TENSOR_DTYPES:
+        tensor_number, values_start, values_end = location
+        dtype = _PACKED_TENSOR_DTYPES[tensor_number]
+        n_values = (values_end - values_start) // dtype.itemsize
+        if out is None:
+            out = np.empty((len(starts), n_values), dtype=dtype)
+
+        # Records that are byte-identical to the first one up to the values hold the same
+        # tensor at the same offset, so the values of all of them can be gathered at once.
+        if (lengths >= values_end).all():
+            spacing = np.diff(starts)
+            if not len(spacing) or (spacing == spacing[0]).all():
+                # Evenly spaced records, the usual case, are read through strided views
+                # of the buffer rather than index matrices larger than the output.
+                stride = int(spacing[0]) if len(spacing) else 0
+                first_start = int(starts[0])
+                prefixes = np.ndarray(
+                    (len(starts), values_start),
+                    dtype=np.uint8,
+                    buffer=buffer,
+                    offset=first_start,
+                    strides=(stride, 1),
+                )
+                values = np.ndarray(
+                    (len(starts), n_values),
+                    dtype=dtype,
+                    buffer=buffer,
+                    offset=first_start + values_start,
+                    strides=(stride, dtype.itemsize),
+                )
+            else:
+                data = np.frombuffer(buffer, dtype=np.uint8)
+                prefixes = data[starts[:, None] + np.arange(values_start)]
+                offsets = starts[:, None] + values_start + np.arange(values_end - values_start)
+                values = data[offsets].view(dtype)
+            if (prefixes == prefixes[0]).all():
+                out[...] = values
+                return out
+
+    for row, (start, length) in enumerate(zip(starts.tolist(), lengths.tolist())):
+        values = _record_tensor_values(buffer[start : start + length], field, field_number, key)
+        if out is None:
+            out = np.empty((len(starts), len(values)), dtype=values.dtype)
+        if len(values) != out.shape[1]:
+            raise ValueError(
+                "Record {} has {} values in {}[{!r}], expected {}".format(
+                    row, len(values), field, key, out.shape[1]
+                )
+            )
+        out[row] = values
+    return out
+
+
+def _record_tensor_values(record, field, field_number, key):
+    """Return the values of ``record.<field>[key]`` of a serialized ``Record`` as an array."""
+    location = _find_tensor(record, field_number, key)
+    if location is not None and location[0] in _PACKED_TENSOR_DTYPES:
+        tensor_number, start, end = location
+        return np.frombuffer(record[start:end], dtype=_PACKED_TENSOR_DTYPES[tensor_number])
+
+    parsed = Record()
+    parsed.ParseFromString(record)
+    tensors = getattr(parsed, field)
+    if key not in tensors:
+        raise ValueError("Record has no {}[{!r}] tensor".format(field, key))
+    value = tensors[key]
+    tensor_type = value.WhichOneof("value") or "float32_tensor"
+    if tensor_type == "bytes":
+        raise ValueError("{}[{!r}] is not a tensor".format(field, key))
+    return np.array(getattr(value, tensor_type).values)
 
 
 def _resolve_type(dtype):
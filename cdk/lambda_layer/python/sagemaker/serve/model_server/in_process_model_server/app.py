@@ -3,11 +3,13 @@
 from __future__ import absolute_import
 
 import asyncio
+import collections
 import io
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import torch
-from typing import Optional, Type
+from typing import Callable, List, Optional, Type
 
 from sagemaker.serve.spec.inference_spec import InferenceSpec
 from sagemaker.serve.builder.schema_builder import SchemaBuilder
@@ -27,6 +29,99 @@ except ImportError:
     logger.error("Unable to import fastapi, check if fastapi is installed.")
 
 
+def _power_of_two_bucket(value: int) -> int:
+    """Largest power of two not above ``value``, or 0 for 0."""
+    return 0 if value <= 0 else 1 << (value.bit_length() - 1)
+
+
+class _MicroBatcher:
+    """Groups concurrent requests into batches that are run with a single model call.
+
+    A batch is formed once a worker is free. It takes every queued request, up to
+    ``max_batch_size``, waiting at most ``max_batch_delay`` seconds for more to
+    arrive. Batches run in ``executor``, off the event loop, and each request
+    receives the result at its position in the batch. If the model call raises,
+    every request of the batch fails with the error.
+    """
+
+    def __init__(
+        self,
+        invoke_batch: Callable[[List[object]], List[object]],
+        executor: ThreadPoolExecutor,
+        num_workers: int,
+        max_batch_size: int,
+        max_batch_delay: float,
+    ):
+        self._invoke_batch = invoke_batch
+        self._executor = executor
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay = max_batch_delay
+        self._queue = asyncio.Queue()
+        self._workers = asyncio.Semaphore(num_workers)
+        self._tasks = set()
+        self._dispatcher = None
+        self.batch_sizes = collections.Counter()
+        self.queue_depths = collections.Counter()
+
+    async def submit(self, item: object) -> object:
+        """Queue ``item`` for the next batch and return its result."""
+        loop = asyncio.get_running_loop()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = loop.create_task(self._dispatch())
+        future = loop.create_future()
+        self.queue_depths[_power_of_two_bucket(self._queue.qsize())] += 1
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def close(self):
+        """Stop forming batches and wait for the batches already running."""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, return_exceptions=True)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _dispatch(self):
+        """Form batches from the queue while workers are available."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._workers.acquire()
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_batch_delay
+            while len(batch) < self._max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self.batch_sizes[len(batch)] += 1
+            task = loop.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        """Run one batch in the executor and hand each request its result."""
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._executor, self._invoke_batch, [item for item, _ in batch]
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._workers.release()
+
+
 class InProcessServer:
     """Generic In-Process Server for Serving Models using InferenceSpec"""
 
@@ -36,7 +131,25 @@ class InProcessServer:
         inference_spec: Optional[InferenceSpec] = None,
         schema_builder: Type[SchemaBuilder] = None,
         task: Optional[str] = None,
+        max_batch_size: int = 1,
+        max_batch_delay: float = 0.01,
+        num_workers: int = 1,
     ):
+        """Initialize an ``InProcessServer``.
+
+        Args:
+            model (str): Name of a Hugging Face model, used when no ``inference_spec`` is given.
+            inference_spec (InferenceSpec): Loads and invokes the model.
+            schema_builder (SchemaBuilder): Deserializes the requests.
+            task (str): Hugging Face pipeline task of ``model``.
+            max_batch_size (int): Most concurrent requests run with a single model call
+                (default: 1, no batching). When above 1, ``inference_spec.invoke`` is
+                called with a list of inputs and must return a list of as many results.
+            max_batch_delay (float): Most seconds to wait for a batch to fill up
+                (default: 0.01).
+            num_workers (int): Number of threads the model runs in, and so the number
+                of batches run at a time (default: 1).
+        """
         self._thread = None
         self._loop = None
         self._stop_event = asyncio.Event()
@@ -49,6 +162,12 @@ class InProcessServer:
         self.model = model
         self.inference_spec = inference_spec
         self.schema_builder = schema_builder
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_batch_delay = max_batch_delay
+        self.num_workers = max(1, num_workers)
+        # Created with the batcher on the first request, and shut down with the server
+        self._executor = None
+        self._batcher = None
 
         if self.inference_spec:
             # Use inference_spec to load the model
@@ -79,6 +198,48 @@ class InProcessServer:
         else:
             raise ValueError("Either inference_spec or model must be provided.")
 
+        def invoke_batch(inputs):
+            """Run the model once on a list of inputs and return a result per input"""
+            if self.inference_spec:
+                if self.max_batch_size == 1:
+                    return [self.inference_spec.invoke(inputs[0], self._load_model)]
+                results = list(self.inference_spec.invoke(inputs, self._load_model))
+                if len(results) != len(inputs):
+                    raise ValueError(
+                        "InferenceSpec.invoke returned %d results for a batch of %d inputs."
+                        % (len(results), len(inputs))
+                    )
+                return results
+
+            inputs = [
+                input_data["inputs"] if "inputs" in input_data else input_data
+                for input_data in inputs
+            ]
+            if isinstance(self._load_model, Pipeline):
+                # The output shape of a pipeline for a list input depends on its task,
+                # so requests are run one at a time.
+                return [
+                    self._load_model(input_data, max_length=30, num_return_sequences=1)
+                    for input_data in inputs
+                ]
+
+            # Encode the sentences of every request together and split the embeddings back.
+            sentences = []
+            for input_data in inputs:
+                sentences.extend([input_data] if isinstance(input_data, str) else input_data)
+            embeddings = self._load_model.encode(sentences, normalize_embeddings=True)
+            results = []
+            start = 0
+            for input_data in inputs:
+                if isinstance(input_data, str):
+                    results.append({"embeddings": embeddings[start].tolist()})
+                    start += 1
+                else:
+                    end = start + len(input_data)
+                    results.append({"embeddings": embeddings[start:end].tolist()})
+                    start = end
+            return results
+
         @self._router.post("/invoke")
         async def invoke(request: Request):
             """Generate text based on the provided prompt"""
@@ -90,19 +251,40 @@ class InProcessServer:
                 io.BytesIO(request_body), content_type[0]
             )
             logger.debug(f"Received request: {input_data}")
-            if self.inference_spec:
-                response = self.inference_spec.invoke(input_data, self._load_model)
-            else:
-                input_data = input_data["inputs"] if "inputs" in input_data else input_data
-                if isinstance(self._load_model, Pipeline):
-                    response = self._load_model(input_data, max_length=30, num_return_sequences=1)
-                else:
-                    embeddings = self._load_model.encode(input_data, normalize_embeddings=True)
-                    response = {"embeddings": embeddings.tolist()}
-            return response
+            if self._batcher is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.num_workers, thread_name_prefix="in-process-model"
+                    )
+                self._batcher = _MicroBatcher(
+                    invoke_batch,
+                    self._executor,
+                    self.num_workers,
+                    self.max_batch_size,
+                    self.max_batch_delay,
+                )
+            return await self._batcher.submit(input_data)
+
+        @self._router.get("/batching-stats")
+        async def batching_stats():
+            """Histograms of batch sizes and of queue depths seen by arriving requests"""
+            return self.batching_stats
 
         self._create_server()
 
+    @property
+    def batching_stats(self) -> dict:
+        """Histograms of the batch sizes run and of the queue depths seen by requests.
+
+        Queue depths are bucketed by powers of two.
+        """
+        if self._batcher is None:
+            return {"batch_size": {}, "queue_depth": {}}
+        return {
+            "batch_size": dict(sorted(self._batcher.batch_sizes.items())),
+            "queue_depth": dict(sorted(self._batcher.queue_depths.items())),
+        }
+
     def _create_server(self):
         """Placeholder docstring"""
         app = FastAPI()
@@ -136,6 +318,12 @@ class InProcessServer:
             self._shutdown_event.set()
             self.server.handle_exit(sig=0, frame=None)
             self._thread.join()
+        # the batcher's queue belongs to the event loop that just stopped
+        self._batcher = None
+        if self._executor is not None:
+            # let model calls still running finish, so no worker threads outlive the server
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
         logger.info("Server shutdown complete.")
 
@@ -147,4 +335,8 @@ class InProcessServer:
 
     async def _serve(self):
         """Placeholder docstring"""
-        await self.server.serve()
+        try:
+            await self.server.serve()
+        finally:
+            if self._batcher is not None:
+                await self._batcher.close()
@@ -17,8 +17,14 @@ class InProcessServing:
         """Initializes the start of the server"""
         from sagemaker.serve.model_server.in_process_model_server.app import InProcessServer
 
+        env_vars = getattr(self, "env_vars", None) or {}
         self.server = InProcessServer(
-            inference_spec=self.inference_spec, model=self.model, schema_builder=self.schema_builder
+            inference_spec=self.inference_spec,
+            model=self.model,
+            schema_builder=self.schema_builder,
+            max_batch_size=int(env_vars.get("IN_PROCESS_MAX_BATCH_SIZE", 1)),
+            max_batch_delay=int(env_vars.get("IN_PROCESS_MAX_BATCH_DELAY_MS", 10)) / 1000,
+            num_workers=int(env_vars.get("IN_PROCESS_NUM_WORKERS", 1)),
         )
         self.server.start_server()
 
@@ -373,7 +373,15 @@ class Session(object):  # pylint: disable=too-many-public-methods
         """Placeholder docstring"""
         return self._region_name
 
-    def upload_data(self, path, bucket=None, key_prefix="data", callback=None, extra_args=None):
+    def upload_data(
+        self,
+        path,
+        bucket=None,
+        key_prefix="data",
+        callback=None,
+        extra_args=None,
+        manifest_path=None,
+    ):
         """Upload local file or directory to S3.
 
         If a single file is specified for upload, the resulting S3 object key is
@@ -382,6 +390,11 @@ class Session(object):  # pylint: disable=too-many-public-methods
         preserving relative structure of subdirectories. The resulting object key names are:
         ``{key_prefix}/{relative_subdirectory_path}/filename``.
 
+        Files of a directory are uploaded concurrently when the session's
+        ``settings.s3_transfer_max_workers`` is greater than 1; ``callback`` is then invoked
+        with the progress of all uploads, one call at a time. ``settings.s3_transfer_config``
+        applies to every file.
+
         Args:
             path (str): Path (absolute or relative) of local file or directory to upload.
             bucket (str): Name of the S3 Bucket to upload to (default: None). If not specified, the
@@ -394,6 +407,8 @@ class Session(object):  # pylint: disable=too-many-public-methods
                 Similar to ExtraArgs parameter in S3 upload_file function. Please refer to the
                 ExtraArgs parameter documentation here:
                 https://boto3.amazonaws.com/v1/documentation/api/latest/guide/s3-uploading-files.html#the-extraargs-parameter
+            manifest_path (str): Optional local path of a JSON file to write the upload manifest
+                to: one entry per uploaded file with its ``LocalPath``, ``S3Uri`` and ``Size``.
 
         Returns:
             str: The S3 URI of the uploaded file(s). If a file is specified in the path argument,
@@ -428,10 +443,18 @@ class Session(object):  # pylint: disable=too-many-public-methods
         else:
             s3 = self.s3_resource
 
-        for local_path, s3_key in files:
-            s3.Object(bucket, s3_key).upload_file(
-                local_path, Callback=callback, ExtraArgs=extra_args
-            )
+        manifest = s3_utils.upload_files(
+            s3,
+            bucket,
+            files,
+            callback=callback,
+            extra_args=extra_args,
+            max_workers=self.settings.s3_transfer_max_workers,
+            transfer_config=self.settings.s3_transfer_config,
+        )
+        if manifest_path:
+            with open(manifest_path, "w") as f:
+                json.dump(manifest, f, indent=2)
 
         s3_uri = "s3://{}/{}".format(bucket, key_prefix)
         # If a specific file was used as input (instead of a directory), we return the full S3 key
@@ -474,6 +497,10 @@ class Session(object):  # pylint: disable=too-many-public-methods
     def download_data(self, path, bucket, key_prefix="", extra_args=None):
         """Download file or directory from S3.
 
+        Files whose local copy already matches the size and ETag of the S3 object are not
+        downloaded again. Objects are downloaded concurrently when the session's
+        ``settings.s3_transfer_max_workers`` is greater than 1.
+
         Args:
             path (str): Local path where the file or directory should be downloaded to.
             bucket (str): Name of the S3 Bucket to download from.
@@ -493,13 +520,13 @@ class Session(object):  # pylint: disable=too-many-public-methods
             s3 = self.s3_client
 
         # Initialize the variables used to loop through the contents of the S3 bucket.
-        keys = []
+        objects = []
         directories = []
         next_token = ""
         base_parameters = {"Bucket": bucket, "Prefix": key_prefix}
 
-        # Loop through the contents of the bucket, 1,000 objects at a time. Gathering all keys into
-        # a "keys" list.
+        # Loop through the contents of the bucket, 1,000 objects at a time. Gathering all objects
+        # into an "objects" list.
         while next_token is not None:
             request_parameters = base_parameters.copy()
             if next_token != "":
@@ -518,26 +545,37 @@ class Session(object):  # pylint: disable=too-many-public-methods
                 if key.endswith("/") and int(obj_size) == 0:
                     directories.append(os.path.join(path, key))
                 else:
-                    keys.append(key)
+                    objects.append(s3_object)
             next_token = response.get("NextContinuationToken")
 
-        # For each object key, create the directory on the local machine if needed, and then
-        # download the file.
-        downloaded_paths = []
+        # For each object, work out its local path. Directories are created on the local
+        # machine as needed while the files are downloaded.
         for dir_path in directories:
             os.makedirs(os.path.dirname(dir_path), exist_ok=True)
-        for key in keys:
+        downloads = []
+        for s3_object in objects:
+            key = s3_object["Key"]
             tail_s3_uri_path = os.path.basename(key)
             if not os.path.splitext(key_prefix)[1]:
                 tail_s3_uri_path = os.path.relpath(key, key_prefix)
-            destination_path = os.path.join(path, tail_s3_uri_path)
-            if not os.path.exists(os.path.dirname(destination_path)):
-                os.makedirs(os.path.dirname(destination_path), exist_ok=True)
-            s3.download_file(
-                Bucket=bucket, Key=key, Filename=destination_path, ExtraArgs=extra_args
+            downloads.append(
+                {
+                    "Key": key,
+                    "Size": s3_object.get("Size"),
+                    "ETag": s3_object.get("ETag"),
+                    "LocalPath": os.path.join(path, tail_s3_uri_path),
+                }
             )
-            downloaded_paths.append(destination_path)
-        return downloaded_paths
+
+        manifest = s3_utils.download_files(
+            s3,
+            bucket,
+            downloads,
+            extra_args=extra_args,
+            max_workers=self.settings.s3_transfer_max_workers,
+            transfer_config=self.settings.s3_transfer_config,
+        )
+        return [entry["LocalPath"] for entry in manifest]
 
     def read_s3_file(self, bucket, key_prefix):
         """Read a single file from S3.
@@ -23,6 +23,8 @@ class SessionSettings(object):
         encrypt_repacked_artifacts=True,
         local_download_dir=None,
         include_jumpstart_tags=True,
+        s3_transfer_max_workers=None,
+        s3_transfer_config=None,
     ) -> None:
         """Initialize the ``SessionSettings`` of a SageMaker ``Session``.
 
@@ -34,10 +36,18 @@ class SessionSettings(object):
                 for downloading artifacts. (Default: None).
             include_jumpstart_tags (bool): Optional. By default, if a JumpStart model is identified,
                 it will receive special tags describing its properties.
+            s3_transfer_max_workers (int): Optional. Number of files transferred concurrently
+                when uploading or downloading a directory. Files are transferred one at a time
+                if not specified (Default: None).
+            s3_transfer_config (boto3.s3.transfer.TransferConfig): Optional. Transfer
+                configuration (multipart threshold and chunk size, per-file concurrency) shared
+                by the file transfers of the session (Default: None).
         """
         self._encrypt_repacked_artifacts = encrypt_repacked_artifacts
         self._local_download_dir = local_download_dir
         self._include_jumpstart_tags = include_jumpstart_tags
+        self._s3_transfer_max_workers = s3_transfer_max_workers
+        self._s3_transfer_config = s3_transfer_config
 
     @property
     def encrypt_repacked_artifacts(self) -> bool:
@@ -53,3 +63,13 @@ class SessionSettings(object):
     def include_jumpstart_tags(self) -> bool:
         """Return True if JumpStart tags should be attached to models with JumpStart artifacts."""
         return self._include_jumpstart_tags
+
+    @property
+    def s3_transfer_max_workers(self) -> int:
+        """Return the number of files transferred concurrently for directory transfers."""
+        return self._s3_transfer_max_workers
+
+    @property
+    def s3_transfer_config(self):
+        """Return the boto3 ``TransferConfig`` shared by the session's file transfers."""
+        return self._s3_transfer_config
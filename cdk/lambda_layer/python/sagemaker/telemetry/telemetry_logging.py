@@ -12,11 +12,15 @@
 # language governing permissions and limitations under the License.
 """Telemetry module for SageMaker Python SDK to collect usage data and metrics."""
 from __future__ import absolute_import
+import atexit
 import logging
 import platform
+import queue
 import sys
+import threading
+import weakref
 from time import perf_counter
-from typing import List
+from typing import Dict, List
 import functools
 import requests
 
@@ -62,6 +66,112 @@ STATUS_TO_CODE = {
     str(Status.FAILURE): 0,
 }
 
+# Most telemetry events waiting to be sent; events emitted while the queue is full are dropped
+TELEMETRY_QUEUE_SIZE = 1000
+# Most events the background worker sends in one go over a single connection
+TELEMETRY_BATCH_SIZE = 50
+# Longest time spent at interpreter exit sending the events still queued
+TELEMETRY_FLUSH_TIMEOUT = 1.0
+
+
+class _TelemetryWorker(object):
+    """Sends telemetry events from a background thread.
+
+    Decorated calls only put their event on a bounded queue. A daemon thread, started on
+    the first event, takes events off the queue in batches and sends them, reusing one HTTP
+    connection, so the calls never wait on the network or on STS.
+    """
+
+    def __init__(self, maxsize: int = TELEMETRY_QUEUE_SIZE):
+        """Initialize a ``_TelemetryWorker`` instance.
+
+        Args:
+            maxsize (int): Maximum number of events waiting to be sent.
+        """
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stats = {
+            "calls": 0,
+            "queued": 0,
+            "dropped": 0,
+            "batches": 0,
+            "sent": 0,
+            "overhead_seconds_total": 0.0,
+        }
+
+    def submit(self, *event) -> None:
+        """Queue the arguments of a ``_send_telemetry_request`` call, without blocking."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            with self._lock:
+                self._stats["dropped"] += 1
+            return
+        with self._lock:
+            self._stats["queued"] += 1
+
+    def record_overhead(self, seconds: float) -> None:
+        """Add the time a decorated call spent on telemetry to the counters."""
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["overhead_seconds_total"] += seconds
+
+    def stats(self) -> Dict[str, float]:
+        """Return a snapshot of the counters.
+
+        ``overhead_seconds_total`` is the time decorated calls spent preparing and queueing
+        events, summed over ``calls``.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def flush(self, timeout: float = TELEMETRY_FLUSH_TIMEOUT) -> bool:
+        """Wait up to ``timeout`` seconds for the queued events to be sent.
+
+        Returns:
+            bool: True if the queue was drained in time.
+        """
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(
+                lambda: not self._queue.unfinished_tasks, timeout
+            )
+
+    def _ensure_started(self) -> None:
+        """Start the background thread if it is not running yet."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="sagemaker-telemetry", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Send queued events until the interpreter exits."""
+        http_session = requests.Session()
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < TELEMETRY_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for event in batch:
+                try:
+                    _send_telemetry_request(*event, http_session=http_session)
+                finally:
+                    self._queue.task_done()
+            with self._lock:
+                self._stats["batches"] += 1
+                self._stats["sent"] += len(batch)
+
+
+_TELEMETRY_WORKER = _TelemetryWorker()
+atexit.register(_TELEMETRY_WORKER.flush)
+
 
 def _telemetry_emitter(feature: str, func_name: str):
     """Telemetry Emitter
@@ -87,11 +197,12 @@ def _telemetry_emitter(feature: str, func_name: str):
                 )
 
             if sagemaker_session:
+                overhead_timer = perf_counter()
                 logger.debug("sagemaker_session found, preparing to emit telemetry...")
                 logger.info(TELEMETRY_OPT_OUT_MESSAGING)
                 response = None
                 caught_ex = None
-                studio_app_type = process_studio_metadata_file()
+                studio_app_type = _get_studio_app_type()
 
                 # Check if telemetry is opted out
                 telemetry_opt_out_flag = resolve_value_from_config(
@@ -133,6 +244,8 @@ def _telemetry_emitter(feature: str, func_name: str):
                     extra += f"&x-endpointArn={sagemaker_session.endpoint_arn}"
 
                 start_timer = perf_counter()
+                stop_timer = start_timer
+                overhead = start_timer - overhead_timer
                 try:
                     # Call the original function
                     response = func(*args, **kwargs)
@@ -140,7 +253,7 @@ def _telemetry_emitter(feature: str, func_name: str):
                     elapsed = stop_timer - start_timer
                     extra += f"&x-latency={round(elapsed, 2)}"
                     if not telemetry_opt_out_flag:
-                        _send_telemetry_request(
+                        _TELEMETRY_WORKER.submit(
                             STATUS_TO_CODE[str(Status.SUCCESS)],
                             feature_list,
                             sagemaker_session,
@@ -153,7 +266,7 @@ def _telemetry_emitter(feature: str, func_name: str):
                     elapsed = stop_timer - start_timer
                     extra += f"&x-latency={round(elapsed, 2)}"
                     if not telemetry_opt_out_flag:
-                        _send_telemetry_request(
+                        _TELEMETRY_WORKER.submit(
                             STATUS_TO_CODE[str(Status.FAILURE)],
                             feature_list,
                             sagemaker_session,
@@ -163,6 +276,7 @@ def _telemetry_emitter(feature: str, func_name: str):
                         )
                     caught_ex = e
                 finally:
+                    _TELEMETRY_WORKER.record_overhead(overhead + perf_counter() - stop_timer)
                     if caught_ex:
                         raise caught_ex
                     return response  # pylint: disable=W0150
@@ -186,6 +300,7 @@ def _send_telemetry_request(
     failure_reason: str = None,
     failure_type: str = None,
     extra_info: str = None,
+    http_session: requests.Session = None,
 ) -> None:
     """Make GET request to an empty object in S3 bucket"""
     try:
@@ -213,7 +328,7 @@ def _send_telemetry_request(
         )
         # Send the telemetry request
         logger.debug("Sending telemetry request to [%s]", url)
-        _requests_helper(url, 2)
+        _requests_helper(url, 2, http_session)
         logger.debug("SageMaker Python SDK telemetry successfully emitted.")
     except Exception:  # pylint: disable=W0703
         logger.debug("SageMaker Python SDK telemetry not emitted!")
@@ -245,34 +360,70 @@ def _construct_url(
     return base_url
 
 
-def _requests_helper(url, timeout):
+def _requests_helper(url, timeout, http_session=None):
     """Make a GET request to the given URL"""
 
     response = None
     try:
-        response = requests.get(url, timeout)
+        response = (http_session or requests).get(url, timeout=timeout)
     except requests.exceptions.RequestException as e:
         logger.exception("Request exception: %s", str(e))
     return response
 
 
+# Account IDs and regions already looked up, per session
+_SESSION_LOOKUPS = weakref.WeakKeyDictionary()
+_SESSION_LOOKUPS_LOCK = threading.Lock()
+
+
+def _cached_session_lookup(session, name, lookup):
+    """Return ``lookup(session)``, computing it only once per session.
+
+    Lookups for sessions that cannot be weakly referenced are not cached.
+    """
+    with _SESSION_LOOKUPS_LOCK:
+        try:
+            cached = _SESSION_LOOKUPS.get(session, {})
+        except TypeError:
+            return lookup(session)
+        if name in cached:
+            return cached[name]
+    value = lookup(session)
+    with _SESSION_LOOKUPS_LOCK:
+        _SESSION_LOOKUPS.setdefault(session, {})[name] = value
+    return value
+
+
 def _get_accountId(session):
     """Return the account ID from the boto session"""
 
-    try:
-        sts = session.boto_session.client("sts")
-        return sts.get_caller_identity()["Account"]
-    except Exception:  # pylint: disable=W0703
-        return None
+    def _lookup(session):
+        try:
+            sts = session.boto_session.client("sts")
+            return sts.get_caller_identity()["Account"]
+        except Exception:  # pylint: disable=W0703
+            return None
+
+    return _cached_session_lookup(session, "account_id", _lookup)
 
 
 def _get_region_or_default(session):
     """Return the region name from the boto session or default to us-west-2"""
 
-    try:
-        return session.boto_session.region_name
-    except Exception:  # pylint: disable=W0703
-        return DEFAULT_AWS_REGION
+    def _lookup(session):
+        try:
+            return session.boto_session.region_name
+        except Exception:  # pylint: disable=W0703
+            return DEFAULT_AWS_REGION
+
+    return _cached_session_lookup(session, "region", _lookup)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_studio_app_type():
+    """Return the SageMaker Studio AppType, reading the metadata file only once"""
+
+    return process_studio_metadata_file()
 
 
 def _get_default_sagemaker_session():
@@ -10,12 +10,17 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
-"""This module defines a LRU cache class."""
+"""This module defines LRU cache classes."""
 from __future__ import absolute_import
 
 import datetime
 import collections
-from typing import Tuple, TypeVar, Generic, Callable, Optional
+import logging
+import threading
+import time
+from typing import Dict, Tuple, TypeVar, Generic, Callable, Optional
+
+logger = logging.getLogger(__name__)
 
 KeyType = TypeVar("KeyType")
 ValType = TypeVar("ValType")
@@ -127,7 +132,7 @@ class LRUCache(Generic[KeyType, ValType]):
 
         if value is None:
             value = self._retrieval_function(  # type: ignore
-                key=key, value=curr_value.element if curr_value else None
+                key=key, value=curr_value.value if curr_value else None
             )
 
         self._lru_cache[key] = self.Element(
@@ -167,3 +172,226 @@ class LRUCache(Generic[KeyType, ValType]):
             return element.value
         except KeyError:
             raise KeyError(f"{key} not found in LRUCache!")
+
+
+class ThreadSafeLRUCache(LRUCache[KeyType, ValType]):
+    """Thread-safe ``LRUCache`` that loads each key at most once at a time.
+
+    Concurrent ``get`` calls for a key that is missing or expired share a single call to
+    ``retrieval_function``: the first caller runs it and the others wait for its result.
+    Optionally, expired elements are served stale for a while as they are refreshed in
+    the background. Hit, miss and load latency counters are available from ``stats``.
+    """
+
+    class _Load:
+        """An in-flight call to ``retrieval_function`` that other callers can wait on."""
+
+        def __init__(self):
+            """Initialize a ``_Load`` instance."""
+            self.done = threading.Event()
+            self.value = None
+            self.error: Optional[BaseException] = None
+
+    def __init__(
+        self,
+        max_cache_items: int,
+        expiration_horizon: datetime.timedelta,
+        retrieval_function: Callable[[KeyType, ValType], ValType],
+        stale_while_revalidate: Optional[datetime.timedelta] = None,
+    ) -> None:
+        """Initialize a ``ThreadSafeLRUCache`` instance.
+
+        Args:
+            max_cache_items (int): Maximum number of items to store in cache.
+            expiration_horizon (datetime.timedelta): Maximum time duration a cache element can
+                persist before being invalidated.
+            retrieval_function (Callable[[KeyType, ValType], ValType]): Function which maps cache
+                keys and current values to new values. This function must have kwarg arguments
+                ``key`` and ``value``. This function is called as a fallback when the key
+                is not found in the cache, or a key has expired.
+            stale_while_revalidate (Optional[datetime.timedelta]): How long past the
+                expiration horizon an element is still returned while it is refreshed in a
+                background thread. Default: None (expired elements are refreshed before
+                being returned).
+        """
+        super(ThreadSafeLRUCache, self).__init__(
+            max_cache_items=max_cache_items,
+            expiration_horizon=expiration_horizon,
+            retrieval_function=retrieval_function,
+        )
+        self._stale_while_revalidate = stale_while_revalidate
+        self._lock = threading.Lock()
+        self._loads: Dict[KeyType, ThreadSafeLRUCache._Load] = {}
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "loads": 0,
+            "load_errors": 0,
+            "load_seconds_total": 0.0,
+            "load_seconds_max": 0.0,
+        }
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Returns a snapshot of the cache counters.
+
+        ``hits`` counts fresh elements returned, ``stale_hits`` expired elements returned
+        while being refreshed in the background and ``misses`` the ``get`` calls that waited
+        for a load. ``loads``, ``load_errors``, ``load_seconds_total`` and
+        ``load_seconds_max`` describe the calls to ``retrieval_function``.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def __len__(self) -> int:
+        """Returns number of elements in cache."""
+        with self._lock:
+            return len(self._lru_cache)
+
+    def __contains__(self, key: KeyType) -> bool:
+        """Returns True if key is found in cache, False otherwise.
+
+        Args:
+            key (KeyType): Key in cache to retrieve.
+        """
+        with self._lock:
+            return key in self._lru_cache
+
+    def clear(self) -> None:
+        """Deletes all elements from the cache.
+
+        Loads that are in flight complete for their callers, but are not stored.
+        """
+        with self._lock:
+            self._lru_cache.clear()
+            self._loads.clear()
+
+    def get(
+        self, key: KeyType, data_source_fallback: Optional[bool] = True
+    ) -> Tuple[ValType, bool]:
+        """Returns value corresponding to key in cache and boolean indicating cache hit.
+
+        Args:
+            key (KeyType): Key in cache to retrieve.
+            data_source_fallback (Optional[bool]): True if data should be retrieved if
+                it's stale or not in cache. Default: True.
+
+        Raises:
+            KeyError: If key is not found in cache or is outdated and
+            ``data_source_fallback`` is False.
+        """
+        with self._lock:
+            element = self._lru_cache.get(key)
+            if element is not None:
+                age = datetime.datetime.now(tz=datetime.timezone.utc) - element.creation_time
+                if age <= self._expiration_horizon:
+                    self._lru_cache.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return element.value, True
+                if not data_source_fallback:
+                    raise KeyError(f"{key} not found in LRUCache!")
+                if (
+                    self._stale_while_revalidate is not None
+                    and age <= self._expiration_horizon + self._stale_while_revalidate
+                ):
+                    self._lru_cache.move_to_end(key)
+                    self._stats["stale_hits"] += 1
+                    load, is_leader = self._start_load(key)
+                    if is_leader:
+                        threading.Thread(
+                            target=self._run_load,
+                            args=(key, load, element.value),
+                            daemon=True,
+                        ).start()
+                    return element.value, True
+            elif not data_source_fallback:
+                raise KeyError(f"{key} not found in LRUCache!")
+
+            self._stats["misses"] += 1
+            load, is_leader = self._start_load(key)
+
+        if is_leader:
+            self._run_load(key, load, element.value if element is not None else None)
+        else:
+            load.done.wait()
+        if load.error is not None:
+            raise load.error
+        return load.value, element is not None
+
+    def put(self, key: KeyType, value: Optional[ValType] = None) -> None:
+        """Adds key to cache using ``retrieval_function``.
+
+        If value is provided, this is used instead. If the key is already in cache,
+        the old element is replaced. If the cache size exceeds the size limit, old
+        elements are removed in order to meet the limit.
+
+        Args:
+            key (KeyType): Key in cache to retrieve.
+            value (Optional[ValType]): Value to store for key. Default: None.
+        """
+        if value is not None:
+            with self._lock:
+                self._store(key, value)
+            return
+
+        with self._lock:
+            element = self._lru_cache.get(key)
+            load, is_leader = self._start_load(key)
+        if is_leader:
+            self._run_load(key, load, element.value if element is not None else None)
+        else:
+            load.done.wait()
+        if load.error is not None:
+            raise load.error
+
+    def _start_load(self, key: KeyType) -> Tuple["ThreadSafeLRUCache._Load", bool]:
+        """Returns the in-flight load of key, registering a new one if there is none.
+
+        Must be called with the lock held. The boolean is True if the caller registered the
+        load and is therefore responsible for running it.
+        """
+        load = self._loads.get(key)
+        if load is not None:
+            return load, False
+        load = self._loads[key] = self._Load()
+        return load, True
+
+    def _run_load(
+        self, key: KeyType, load: "ThreadSafeLRUCache._Load", curr_value: Optional[ValType]
+    ) -> None:
+        """Calls ``retrieval_function`` for key, stores the result and wakes up waiters."""
+        start = time.perf_counter()
+        try:
+            load.value = self._retrieval_function(  # type: ignore
+                key=key, value=curr_value
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            load.error = e
+            logger.debug("Failed to load %s into cache: %s", key, e)
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self._stats["loads"] += 1
+            self._stats["load_seconds_total"] += elapsed
+            self._stats["load_seconds_max"] = max(self._stats["load_seconds_max"], elapsed)
+            if load.error is not None:
+                self._stats["load_errors"] += 1
+            # The load may have been dropped by ``clear`` while it was running.
+            if self._loads.get(key) is load:
+                del self._loads[key]
+                if load.error is None:
+                    self._store(key, load.value)
+        load.done.set()
+
+    def _store(self, key: KeyType, value: ValType) -> None:
+        """Stores value as a fresh element, evicting the least recently used ones if needed.
+
+        Must be called with the lock held.
+        """
+        self._lru_cache.pop(key, None)
+        while len(self._lru_cache) >= self._max_cache_items:
+            self._lru_cache.popitem(last=False)
+        self._lru_cache[key] = self.Element(
+            value=value, creation_time=datetime.datetime.now(tz=datetime.timezone.utc)
+        )
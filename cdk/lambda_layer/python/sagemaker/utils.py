@@ -15,7 +15,6 @@ from __future__ import absolute_import
 
 import contextlib
 import copy
-import errno
 import inspect
 import logging
 import os
@@ -41,7 +40,7 @@ from botocore.utils import merge_dicts
 from six.moves.urllib import parse
 from six import viewitems
 
-from sagemaker import deprecations
+from sagemaker import deprecations, s3_utils
 from sagemaker.config import validate_sagemaker_config
 from sagemaker.config.config_utils import (
     _log_sagemaker_config_single_substitution,
@@ -417,35 +416,58 @@ def download_folder(bucket_name, prefix, target, sagemaker_session):
             else:
                 raise
 
-    _download_files_under_prefix(bucket_name, prefix, target, s3)
+    settings = getattr(sagemaker_session, "settings", None) or SessionSettings()
+    _download_files_under_prefix(
+        bucket_name,
+        prefix,
+        target,
+        s3,
+        max_workers=settings.s3_transfer_max_workers,
+        transfer_config=settings.s3_transfer_config,
+    )
 
 
-def _download_files_under_prefix(bucket_name, prefix, target, s3):
+def _download_files_under_prefix(
+    bucket_name, prefix, target, s3, max_workers=None, transfer_config=None
+):
     """Download all S3 files which match the given prefix
 
+    Files whose local copy already matches the size and ETag of the S3 object are skipped.
+
     Args:
         bucket_name (str): S3 bucket name
         prefix (str): S3 prefix within the bucket that will be downloaded
         target (str): destination path where the downloaded items will be placed
         s3 (boto3.resources.base.ServiceResource): S3 resource
+        max_workers (int): number of files downloaded concurrently (default: None, one at
+            a time)
+        transfer_config (boto3.s3.transfer.TransferConfig): transfer configuration shared by
+            the downloads (default: None)
     """
     bucket = s3.Bucket(bucket_name)
+    downloads = []
     for obj_sum in bucket.objects.filter(Prefix=prefix):
         # if obj_sum is a folder object skip it.
         if obj_sum.key.endswith("/"):
             continue
-        obj = s3.Object(obj_sum.bucket_name, obj_sum.key)
         s3_relative_path = obj_sum.key[len(prefix) :].lstrip("/")
-        file_path = os.path.join(target, s3_relative_path)
+        downloads.append(
+            {
+                "Key": obj_sum.key,
+                "Size": obj_sum.size,
+                "ETag": obj_sum.e_tag,
+                "LocalPath": os.path.join(target, s3_relative_path),
+            }
+        )
 
-        try:
-            os.makedirs(os.path.dirname(file_path))
-        except OSError as exc:
-            # EEXIST means the folder already exists, this is safe to skip
-            # anything else will be raised.
-            if exc.errno != errno.EEXIST:
-                raise
-        obj.download_file(file_path)
+    # The resource is not thread-safe, so downloads go through its client.
+    s3_utils.download_files(
+        s3.meta.client,
+        bucket_name,
+        downloads,
+        max_workers=max_workers,
+        transfer_config=transfer_config,
+    )
 
 
 def create_tar_file(source_files, target=None):
@@ -755,6 +777,7 @@ def retry_with_backoff(callable_func, num_attempts=8, botocore_client_error_code
             time.sleep(2**i)
 
 
+@lru_cache(maxsize=None)
 def _botocore_resolver():
     """Get the DNS suffix for the given region.
 
@@ -764,6 +787,7 @@ def _botocore_resolver():
     Returns:
         str: the DNS suffix
     """
+    # Loading the endpoints data is slow, so the resolver is created once per process.
     loader = botocore.loaders.create_loader()
     return botocore.regions.EndpointResolver(loader.load_data("endpoints"))
 
@@ -1,80 +1,435 @@
 import sys
 import boto3
+import numpy as np
 import pandas as pd
 import json
+import zlib
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from urllib.parse import unquote
 from awsglue.utils import getResolvedOptions
 
 args = getResolvedOptions(sys.argv, ['JOB_NAME'])
 
+def get_optional_arg(name, default):
+    # getResolvedOptions fails on arguments that were not passed to the job
+    if f"--{name}" in sys.argv:
+        return getResolvedOptions(sys.argv, [name])[name]
+    return default
+
+# csv reads aggregated/, parquet reads the partitioned aggregated_parquet/ layer
+input_format = get_optional_arg("INPUT_FORMAT", "csv").lower()
+# Ignore the persisted series state and rebuild every series from scratch
+full_rebuild = get_optional_arg("FULL_REBUILD", "false").lower() == "true"
+# department emits a series per department; sku a series per (department, product_id)
+granularity = get_optional_arg("GRANULARITY", "department").lower()
+# SKU output is spread over this many train/test part files
+num_shards = int(get_optional_arg("NUM_SHARDS", 16))
+# Comma-separated dynamic_feat columns for SKU series: units, avg_price
+dynamic_features = [name for name in get_optional_arg("DYNAMIC_FEATURES", "").split(",") if name]
+max_workers = int(get_optional_arg("MAX_WORKERS", 16))
+
 # S3 Config
-s3 = boto3.client('s3')
+# Size the connection pool to the worker count so threads don't queue on it
+s3 = boto3.client('s3', config=Config(max_pool_connections=max_workers))
 bucket = "cdkstack-inventorydatabucket1b7c2a3c-dsqfppsvh2hm"
-aggregated_prefix = "aggregated/"
 output_prefix = "deepar/"
+sku_output_prefix = f"{output_prefix}sku/"
+if granularity == "sku":
+    aggregated_prefix = "aggregated_sku/"
+    aggregated_parquet_prefix = "aggregated_sku_parquet/"
+    value_columns = ["product_id", "total_sales", "units"]
+else:
+    aggregated_prefix = "aggregated/"
+    aggregated_parquet_prefix = "aggregated_parquet/"
+    value_columns = ["total_sales"]
+state_key = f"{output_prefix}state/series.npz"
+train_key = f"{output_prefix}train/train.json"
+test_key = f"{output_prefix}test/test.json"
+
+def partition_values(key):
+    """Parse hive-style `name=value` path segments of a key into a dict."""
+    return dict(
+        (name, unquote(value))
+        for name, _, value in (segment.partition("=") for segment in key.split("/"))
+        if value
+    )
+
+def read_aggregated_csv(content, key):
+    return pd.read_csv(BytesIO(content), dtype={"department": str, "product_id": str})
+
+def read_aggregated_parquet(content, key):
+    # date and department come from the partition path and are not decoded
+    values = partition_values(key)
+    df = pd.read_parquet(BytesIO(content), columns=value_columns)
+    return df.assign(date=values["date"], department=values["department"])
+
+def load_state():
+    """Return the series store written by the last run, or None.
+
+    The store is one float matrix with a row per department and a column
+    per day from `start`, plus the listing watermark, the number of series
+    in the train/test files it produced and the ETags of those files.
+    """
+    try:
+        obj = s3.get_object(Bucket=bucket, Key=state_key)
+    except s3.exceptions.NoSuchKey:
+        return None
+    with np.load(BytesIO(obj["Body"].read()), allow_pickle=False) as state:
+        return {
+            "departments": state["departments"].tolist(),
+            "start": pd.Timestamp(str(state["start"])),
+            "values": state["values"],
+            "watermark": pd.Timestamp(str(state["watermark"])),
+            "lines_written": int(state["lines_written"]),
+            # Stores from before ETags were recorded can't vouch for the outputs
+            "output_etags": state["output_etags"].tolist() if "output_etags" in state.files else None,
+        }
+
+def save_state(departments, start, values, watermark, lines_written, output_etags):
+    buffer = BytesIO()
+    np.savez_compressed(
+        buffer,
+        departments=np.array(departments, dtype=str),
+        start=np.array(str(start.date())),
+        values=values,
+        watermark=np.array(watermark.isoformat()),
+        lines_written=np.array(lines_written),
+        output_etags=np.array(output_etags, dtype=str),
+    )
+    s3.put_object(Bucket=bucket, Key=state_key, Body=buffer.getvalue())
+
+def current_etags(keys):
+    """Return the ETag of each key, or None for keys that don't exist."""
+    etags = []
+    for key in keys:
+        try:
+            etags.append(s3.head_object(Bucket=bucket, Key=key)["ETag"])
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in ("404", "NoSuchKey"):
+                raise
+            etags.append(None)
+    return etags
+
+forecast_horizon = 7
+# Series formatted per to_csv call; bounds the size of the formatted text
+chunk_series = 1024
+part_size = 8 * 1024 * 1024
+
+class MultipartWriter:
+    """Stream bytes into one S3 object through a multipart upload.
+
+    Writes are buffered until a full part is available; S3 requires every
+    part except the last to be at least 5 MiB.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.buffer = BytesIO()
+        self.parts = []
+        self.bytes_written = 0
+        self.etag = None
+        self.upload_id = s3.create_multipart_upload(Bucket=bucket, Key=key)["UploadId"]
+
+    def write(self, data):
+        self.buffer.write(data)
+        if self.buffer.tell() >= part_size:
+            self._upload_part()
+
+    def _upload_part(self):
+        body = self.buffer.getvalue()
+        number = len(self.parts) + 1
+        response = s3.upload_part(
+            Bucket=bucket, Key=self.key, UploadId=self.upload_id, PartNumber=number, Body=body
+        )
+        self.parts.append({"PartNumber": number, "ETag": response["ETag"]})
+        self.bytes_written += len(body)
+        self.buffer = BytesIO()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            s3.abort_multipart_upload(Bucket=bucket, Key=self.key, UploadId=self.upload_id)
+            return False
+        if self.buffer.tell() or not self.parts:
+            self._upload_part()
+        self.etag = s3.complete_multipart_upload(
+            Bucket=bucket, Key=self.key, UploadId=self.upload_id, MultipartUpload={"Parts": self.parts}
+        )["ETag"]
+
+def csv_rows(matrix):
+    """Format each row of a float matrix as comma-separated values in one pass."""
+    return pd.DataFrame(matrix).to_csv(header=False, index=False, lineterminator="\n").splitlines()
+
+def line_tail(cat):
+    return f'], "cat": {json.dumps(cat)}}}\n'.encode("utf-8")
+
+def json_lines(matrix, cats, start_date, features=()):
+    """Yield one DeepAR JSON line per row of matrix.
+
+    Targets (and any dynamic feature matrices, which have the same shape)
+    are formatted a block of rows at a time by to_csv, straight from the
+    float matrix, instead of building a Python list per series.
+    """
+    head = ('{"start": %s, "target": [' % json.dumps(start_date)).encode("utf-8")
+    feature_rows = [csv_rows(feature) for feature in features]
+    for row, (cat, target) in enumerate(zip(cats, csv_rows(matrix))):
+        if feature_rows:
+            dynamic = "], [".join(rows[row] for rows in feature_rows)
+            tail = f'], "cat": {json.dumps(cat)}, "dynamic_feat": [[{dynamic}]]}}\n'.encode("utf-8")
+        else:
+            tail = line_tail(cat)
+        yield head + target.encode("utf-8") + tail
+
+def extend_line(line, cat, extra):
+    """Append already formatted values to the target array of a previous line."""
+    tail = line_tail(cat)
+    if not line.endswith(tail):
+        raise ValueError(f"Unexpected line format for {cat}")
+    return line[:-len(tail)] + b"," + extra.encode("utf-8") + tail
+
+def previous_lines(key):
+    obj = s3.get_object(Bucket=bucket, Key=key)
+    for line in obj["Body"].iter_lines():
+        if line:
+            yield line + b"\n"
+
+
+def list_aggregated_objects(prefix, suffix):
+    paginator = s3.get_paginator("list_objects_v2")
+    return [
+        obj
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix)
+        for obj in page.get("Contents", [])
+        if obj["Key"].endswith(suffix)
+    ]
+
+def dynamic_feature(name, daily, rows, cols, shape):
+    """Build a (series x day) matrix for one of the supported dynamic features."""
+    if name == "units":
+        feature = np.zeros(shape)
+        feature[rows, cols] = daily["units"].to_numpy()
+        return feature
+    if name == "avg_price":
+        feature = np.full(shape, np.nan)
+        feature[rows, cols] = (daily["total_sales"] / daily["units"]).to_numpy()
+        # Carry the last observed price over days without sales
+        return pd.DataFrame(feature).ffill(axis=1).bfill(axis=1).fillna(0.0).to_numpy()
+    raise ValueError(f"Unknown dynamic feature {name}")
+
+def build_sku_dataset(prefix, suffix):
+    """Write one DeepAR series per (department, product_id) into hashed shards.
+
+    A series is assigned to train/part-NNNNN.json and test/part-NNNNN.json by
+    a stable hash of its id, so it always lands in the same shard and
+    SageMaker can read the shards in parallel.
+    """
+    keys = [obj["Key"] for obj in list_aggregated_objects(prefix, suffix)]
+    print(f"{len(keys)} aggregated SKU files to read")
+
+    def read(key):
+        return read_aggregated(s3.get_object(Bucket=bucket, Key=key)["Body"].read(), key)
 
-# Step 1: List all aggregated files
-response = s3.list_objects_v2(Bucket=bucket, Prefix=aggregated_prefix)
-keys = [obj["Key"] for obj in response.get("Contents", []) if obj["Key"].endswith(".csv")]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        all_data = list(pool.map(read, keys))
 
-# Step 2: Load all CSVs into one DataFrame
+    if not all_data:
+        print("No aggregated data found.")
+        return
+
+    df = pd.concat(all_data, ignore_index=True)
+    df["date"] = pd.to_datetime(df["date"])
+    df["department"] = df["department"].astype(str)
+    df["product_id"] = df["product_id"].astype(str)
+    daily = df.groupby(["department", "product_id", "date"])[["total_sales", "units"]].sum().reset_index()
+
+    series = daily[["department", "product_id"]].drop_duplicates(ignore_index=True)
+    rows = daily.groupby(["department", "product_id"]).ngroup().to_numpy()
+    start = daily["date"].min()
+    cols = (daily["date"] - start).dt.days.to_numpy()
+    shape = (len(series), int(cols.max()) + 1)
+
+    if shape[1] <= forecast_horizon:
+        print(f"Skipping {len(series)} SKU series – not enough data ({shape[1]} days)")
+        return
+
+    target = np.zeros(shape)
+    target[rows, cols] = daily["total_sales"].to_numpy()
+    features = [dynamic_feature(name, daily, rows, cols, shape) for name in dynamic_features]
+
+    cats = [[department, product_id] for department, product_id in zip(series["department"], series["product_id"])]
+    shard_of = np.array([zlib.crc32(f"{d}/{p}".encode("utf-8")) % num_shards for d, p in cats])
+    start_date = str(start.date())
+
+    def write_shard(shard):
+        members = np.flatnonzero(shard_of == shard)
+        train_key = f"{sku_output_prefix}train/part-{shard:05d}.json"
+        test_key = f"{sku_output_prefix}test/part-{shard:05d}.json"
+        with MultipartWriter(train_key) as train_out, MultipartWriter(test_key) as test_out:
+            for first in range(0, len(members), chunk_series):
+                block = members[first:first + chunk_series]
+                block_cats = [cats[row] for row in block]
+                train_features = [feature[block, :-forecast_horizon] for feature in features]
+                for line in json_lines(target[block, :-forecast_horizon], block_cats, start_date, train_features):
+                    train_out.write(line)
+                for line in json_lines(target[block], block_cats, start_date, [feature[block] for feature in features]):
+                    test_out.write(line)
+        return train_key, test_key
+
+    # Empty shards are not written; SageMaker rejects empty channel files
+    shards = [shard for shard in range(num_shards) if (shard_of == shard).any()]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        written = {key for keys_written in pool.map(write_shard, shards) for key in keys_written}
+
+    # Remove parts left over from a run with a different shard count
+    stale = [obj["Key"] for obj in list_aggregated_objects(sku_output_prefix, ".json") if obj["Key"] not in written]
+    for first in range(0, len(stale), 1000):
+        s3.delete_objects(
+            Bucket=bucket, Delete={"Objects": [{"Key": key} for key in stale[first:first + 1000]], "Quiet": True}
+        )
+
+    print(f"Wrote {len(series)} SKU series to {len(shards)} shards under {sku_output_prefix}")
+
+if input_format == "parquet":
+    source_prefix, suffix, read_aggregated = aggregated_parquet_prefix, ".parquet", read_aggregated_parquet
+else:
+    source_prefix, suffix, read_aggregated = aggregated_prefix, ".csv", read_aggregated_csv
+
+if granularity == "sku":
+    build_sku_dataset(source_prefix, suffix)
+    print("DeepAR datasets generated successfully.")
+    sys.exit()
+
+state = None if full_rebuild else load_state()
+
+# Step 1: List aggregated files, keeping only those changed since the last run.
+# Partitions hold absolute totals, so re-reading one at the watermark is harmless.
+objects = list_aggregated_objects(source_prefix, suffix)
+if state is not None:
+    objects = [obj for obj in objects if obj["LastModified"] >= state["watermark"]]
+keys = [obj["Key"] for obj in objects]
+print(f"{len(keys)} aggregated files to read" + (" (full rebuild)" if state is None else ""))
+
+# Step 2: Load the changed aggregated files into one DataFrame
 all_data = []
 for key in keys:
     obj = s3.get_object(Bucket=bucket, Key=key)
     content = obj['Body'].read()
-    df = pd.read_csv(BytesIO(content))
+    df = read_aggregated(content, key)
     all_data.append(df)
 
-if not all_data:
+if not all_data and state is None:
     print("No aggregated data found.")
     sys.exit()
 
+if not all_data:
+    print("No aggregated files changed since the last run. Outputs are up to date.")
+    sys.exit()
+
+watermark = max(obj["LastModified"] for obj in objects)
+
 df = pd.concat(all_data, ignore_index=True)
 df["date"] = pd.to_datetime(df["date"])
 df["department"] = df["department"].astype(str)
+updates = df.groupby(["department", "date"])["total_sales"].sum().reset_index()
+
+# Step 3: Merge the updates into the per-department series store
+old_departments = state["departments"] if state is not None else []
+old_values = state["values"] if state is not None else np.zeros((0, 0))
+old_days = old_values.shape[1]
+old_start = state["start"] if state is not None else updates["date"].min()
+
+start = min(old_start, updates["date"].min())
+end = max(old_start + pd.Timedelta(days=old_days - 1), updates["date"].max())
+days = (end - start).days + 1
+shift = (old_start - start).days
+
+row_of = {department: row for row, department in enumerate(old_departments)}
+departments = list(old_departments)
+for department in updates["department"].unique():
+    if department not in row_of:
+        row_of[department] = len(departments)
+        departments.append(department)
+
+values = np.zeros((len(departments), days))
+values[:len(old_departments), shift:shift + old_days] = old_values
+rows = updates["department"].map(row_of).to_numpy()
+cols = (updates["date"] - start).dt.days.to_numpy()
+values[rows, cols] = updates["total_sales"].to_numpy()
 
-# Step 3: Pivot data to time series per department
-grouped = df.groupby(["department", "date"]).sum().reset_index()
-pivoted = grouped.pivot(index="date", columns="department", values="total_sales").fillna(0)
-pivoted = pivoted.sort_index()
+changed = np.zeros(len(departments), dtype=bool)
+changed[rows] = True
 
 # Step 4: Create DeepAR format
-train_data = []
-test_data = []
+start_date = str(start.date())
+enough_history = days > forecast_horizon
 
-forecast_horizon = 7
+# Series that received no updates are copied from the previous files. If
+# the date range only grew at the end, their targets gain the new trailing
+# days; any other change to the range regenerates every series. The files
+# must still be the ones the state describes: a run that failed between
+# writing them and saving the state leaves them out of step with it.
+copy_through = (
+    state is not None
+    and shift == 0
+    and old_days > forecast_horizon
+    and state["lines_written"] == len(old_departments)
+    and enough_history
+    and state["output_etags"] == current_etags([train_key, test_key])
+)
+if not copy_through:
+    changed[:] = True
+
+if not enough_history:
+    for department in departments:
+        print(f"Skipping {department} – not enough data ({days} days)")
+
+# Step 5: Stream train (history minus the horizon) and test (full history) to S3
+series_written = len(departments) if enough_history else 0
+added_days = days - old_days
+
+with MultipartWriter(train_key) as train_out, MultipartWriter(test_key) as test_out:
+    old_train = previous_lines(train_key) if copy_through else None
+    old_test = previous_lines(test_key) if copy_through else None
+    for first in range(0, series_written, chunk_series):
+        block = slice(first, min(first + chunk_series, series_written))
+        block_departments = departments[block]
+        block_changed = changed[block]
+        changed_cats = [[d] for d, c in zip(block_departments, block_changed) if c]
+
+        regenerated_train = json_lines(
+            values[block][block_changed, :-forecast_horizon], changed_cats, start_date
+        )
+        regenerated_test = json_lines(values[block][block_changed], changed_cats, start_date)
+        if added_days and not block_changed.all():
+            # Values that moved out of the horizon into train, and new test days
+            train_extra = iter(csv_rows(
+                values[block][~block_changed, old_days - forecast_horizon:days - forecast_horizon]
+            ))
+            test_extra = iter(csv_rows(values[block][~block_changed, old_days:]))
+
+        for row, department in enumerate(block_departments, start=first):
+            if copy_through and row < len(old_departments):
+                train_line, test_line = next(old_train), next(old_test)
+            if changed[row]:
+                train_out.write(next(regenerated_train))
+                test_out.write(next(regenerated_test))
+            elif added_days:
+                train_out.write(extend_line(train_line, [department], next(train_extra)))
+                test_out.write(extend_line(test_line, [department], next(test_extra)))
+            else:
+                train_out.write(train_line)
+                test_out.write(test_line)
+
+save_state(departments, start, values, watermark, series_written, [train_out.etag, test_out.etag])
 
-for department in pivoted.columns:
-    target = pivoted[department].tolist()
-    start_date = str(pivoted.index[0].date())
-
-    if len(target) <= forecast_horizon:
-        print(f"Skipping {department} – not enough data ({len(target)} days)")
-        continue
-
-    full_series = {
-        "start": start_date,
-        "target": target,
-        "cat": [department]
-    }
-
-    train_series = {
-        "start": start_date,
-        "target": target[:-forecast_horizon],
-        "cat": [department]
-    }
-
-    train_data.append(train_series)
-    test_data.append(full_series)
-
-# Step 5: Write to S3
-def write_jsonl(data, s3_path):
-    json_lines = "\n".join([json.dumps(rec) for rec in data])
-    s3.put_object(Bucket=bucket, Key=s3_path, Body=json_lines.encode("utf-8"))
-    print(f"Wrote {len(data)} series to {s3_path}")
-
-write_jsonl(train_data, f"{output_prefix}train/train.json")
-write_jsonl(test_data, f"{output_prefix}test/test.json")
+print(f"{int(changed[:series_written].sum())} of {series_written} series regenerated, the rest copied through")
+print(f"Wrote {series_written} series to {train_key} ({train_out.bytes_written} bytes)")
+print(f"Wrote {series_written} series to {test_key} ({test_out.bytes_written} bytes)")
 
 print("DeepAR datasets generated successfully.")
@@ -0,0 +1,117 @@
+"""Benchmark numeric CSV serialization in the vendored SageMaker SDK.
+
+Compares CSVSerializer, NumpyDeserializer and CSVDeserializer with the
+per-row csv.writer, genfromtxt and csv.reader code they replaced, on a
+10-column matrix, and checks that both give the same result.
+
+    python tests/benchmarks/bench_csv_serialization.py [--rows 1000 100000 1000000]
+"""
+import argparse
+import codecs
+import csv
+import io
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "lambda_layer", "python"))
+
+from sagemaker.base_deserializers import CSVDeserializer, NumpyDeserializer  # noqa: E402
+from sagemaker.base_serializers import CSVSerializer  # noqa: E402
+
+
+def serialize_per_row(data):
+    """What CSVSerializer.serialize did before: one csv.writer per row."""
+    if isinstance(data, pd.DataFrame):
+        return data.to_csv(header=False, index=False)
+
+    def serialize_row(row):
+        buffer = io.StringIO()
+        csv.writer(buffer, delimiter=",").writerow(np.ndarray.flatten(row))
+        return buffer.getvalue().rstrip("\r\n")
+
+    return "\n".join([serialize_row(row) for row in data])
+
+
+def deserialize_genfromtxt(body, dtype=None):
+    """What NumpyDeserializer did before for text/csv."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return np.genfromtxt(
+            codecs.getreader("utf-8")(io.BytesIO(body)), delimiter=",", dtype=dtype
+        )
+
+
+def deserialize_csv_reader(body):
+    """What CSVDeserializer did before."""
+    return list(csv.reader(body.decode("utf-8").splitlines()))
+
+
+def timed(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeats
+
+
+def same(expected, actual):
+    if isinstance(expected, np.ndarray):
+        return expected.dtype == actual.dtype and np.array_equal(expected, actual)
+    return expected == actual
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 100000])
+    row_counts = parser.parse_args().rows
+
+    serializer = CSVSerializer()
+    numpy_deserializer = NumpyDeserializer()
+    csv_deserializer = CSVDeserializer()
+    rng = np.random.default_rng(0)
+
+    print("10 columns, old -> new seconds:")
+    for rows in row_counts:
+        # Average small inputs over several runs
+        repeats = min(20, max(1, 100000 // rows))
+        floats = rng.random((rows, 10))
+        ints = rng.integers(0, 100000, (rows, 10))
+        frame = pd.DataFrame(floats)
+        float_body = serializer.serialize(floats).encode("utf-8")
+        int_body = serializer.serialize(ints).encode("utf-8")
+
+        cases = [
+            ("ser f64", lambda: serialize_per_row(floats), lambda: serializer.serialize(floats)),
+            ("ser int", lambda: serialize_per_row(ints), lambda: serializer.serialize(ints)),
+            ("ser df f64", lambda: serialize_per_row(frame), lambda: serializer.serialize(frame)),
+            (
+                "np f64",
+                lambda: deserialize_genfromtxt(float_body),
+                lambda: numpy_deserializer.deserialize(io.BytesIO(float_body), "text/csv"),
+            ),
+            (
+                "np int",
+                lambda: deserialize_genfromtxt(int_body),
+                lambda: numpy_deserializer.deserialize(io.BytesIO(int_body), "text/csv"),
+            ),
+            (
+                "csv lists",
+                lambda: deserialize_csv_reader(float_body),
+                lambda: csv_deserializer.deserialize(io.BytesIO(float_body), "text/csv"),
+            ),
+        ]
+        for name, old, new in cases:
+            expected, old_seconds = timed(old, repeats)
+            actual, new_seconds = timed(new, repeats)
+            print(
+                f"  {rows:>8} rows {name:<10} {old_seconds:8.4f} -> {new_seconds:8.4f} "
+                f"({old_seconds / new_seconds:.1f}x), identical={same(expected, actual)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,70 +1,302 @@
 import sys
+import json
+import time
 import boto3
 import pandas as pd
 from io import BytesIO
+from urllib.parse import quote, unquote
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from awsglue.utils import getResolvedOptions
 from datetime import datetime
 
 # Step 0: Get job arguments
 args = getResolvedOptions(sys.argv, ['JOB_NAME'])
 
+def get_optional_arg(name, default):
+    # getResolvedOptions fails on arguments that were not passed to the job
+    if f"--{name}" in sys.argv:
+        return getResolvedOptions(sys.argv, [name])[name]
+    return default
+
+max_workers = int(get_optional_arg('MAX_WORKERS', 16))
+write_retries = int(get_optional_arg('WRITE_RETRIES', 3))
+# Re-aggregate all of clean/ and overwrite every partition (for backfills)
+full_rebuild = get_optional_arg('FULL_REBUILD', 'false').lower() == 'true'
+# json/csv keep the original layout; parquet uses the partitioned layers
+input_format = get_optional_arg('INPUT_FORMAT', 'json').lower()
+output_format = get_optional_arg('OUTPUT_FORMAT', 'csv').lower()
+# department sums per (date, department); sku also splits by product_id
+granularity = get_optional_arg('GRANULARITY', 'department').lower()
+
 # Step 1: Setup S3 client and configuration
-s3 = boto3.client('s3')
+# Size the connection pool to the worker count so threads don't queue on it
+s3 = boto3.client('s3', config=Config(max_pool_connections=max_workers))
 bucket = "cdkstack-inventorydatabucket1b7c2a3c-dsqfppsvh2hm"
 clean_prefix = "clean/"
-aggregated_prefix = "aggregated/"
+clean_parquet_prefix = "clean_parquet/"
+
+if granularity == 'sku':
+    # One file per (date, department) holding a row per product
+    aggregated_prefix = "aggregated_sku/"
+    aggregated_parquet_prefix = "aggregated_sku_parquet/"
+    group_columns = ['date', 'department', 'product_id']
+    aggregations = {'total_sales': ('price_numeric', 'sum'), 'units': ('price_numeric', 'size')}
+else:
+    aggregated_prefix = "aggregated/"
+    aggregated_parquet_prefix = "aggregated_parquet/"
+    group_columns = ['date', 'department']
+    aggregations = {'total_sales': ('price_numeric', 'sum')}
+value_columns = list(aggregations)
+
+# Each output layer tracks the clean keys it has consumed separately
+output_layer = aggregated_parquet_prefix if output_format == 'parquet' else aggregated_prefix
+manifest_key = f"manifests/{output_layer}manifest.json"
+# Earlier versions kept a single manifest, used for the default CSV layer
+legacy_manifest_keys = ["manifests/aggregation/manifest.json"] if output_layer == "aggregated/" else []
+
+# Only these columns are needed from the clean layer
+clean_columns = ['timestamp', 'department', 'price_numeric'] + group_columns[2:]
 
 def log(msg):
     print(f"[Glue ETL] {msg}")
 
-# Step 2: List JSON files in clean/ folder
-response = s3.list_objects_v2(Bucket=bucket, Prefix=clean_prefix)
-keys = [obj['Key'] for obj in response.get('Contents', []) if obj['Key'].endswith('.json')]
+def list_keys(prefix, suffix):
+    paginator = s3.get_paginator('list_objects_v2')
+    keys = []
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        keys.extend(obj['Key'] for obj in page.get('Contents', []) if obj['Key'].endswith(suffix))
+    return keys
+
+def run_all(keys, fn, workers, action):
+    """Run fn(key) for every key on a bounded thread pool.
+
+    Returns a dict of key -> result and a dict of failed key -> error.
+    """
+    results = {}
+    failed = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fn, key): key for key in keys}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                failed[key] = str(e)
+                log(f"Failed to {action} {key}: {e}")
+    return results, failed
+
+def read_json_lines(key):
+    obj = s3.get_object(Bucket=bucket, Key=key)
+    content = obj['Body'].read()
+    return pd.read_json(BytesIO(content), lines=True)
+
+def partition_values(key):
+    """Parse hive-style `name=value` path segments of a key into a dict."""
+    return dict(
+        (name, unquote(value))
+        for name, _, value in (segment.partition('=') for segment in key.split('/'))
+        if value
+    )
+
+def read_clean_parquet(key):
+    # department is a partition column, so only the remaining columns are decoded
+    obj = s3.get_object(Bucket=bucket, Key=key)
+    df = pd.read_parquet(BytesIO(obj['Body'].read()), columns=[c for c in clean_columns if c != 'department'])
+    return df.assign(department=partition_values(key)['department'])[clean_columns]
+
+def load_manifest():
+    """Return (processed clean keys, pending partition rows) from the last run.
+
+    Falls back to the legacy manifest location, and returns None if there is
+    no manifest yet. The next save writes to manifest_key.
+    """
+    for key in [manifest_key, *legacy_manifest_keys]:
+        try:
+            obj = s3.get_object(Bucket=bucket, Key=key)
+            break
+        except s3.exceptions.NoSuchKey:
+            continue
+    else:
+        return None
+    if key != manifest_key:
+        log(f"Migrating manifest from {key} to {manifest_key}")
+    manifest = json.loads(obj['Body'].read())
+    pending = {
+        key: rows if isinstance(rows, list) else [rows]
+        for key, rows in manifest.get('pending_partitions', {}).items()
+    }
+    return set(manifest.get('processed_keys', [])), pending
+
+def save_manifest(processed_keys, pending_partitions):
+    manifest = {
+        'updated_at': datetime.utcnow().isoformat(),
+        'processed_keys': sorted(processed_keys),
+        'pending_partitions': pending_partitions,
+    }
+    s3.put_object(Bucket=bucket, Key=manifest_key, Body=json.dumps(manifest))
+
+def put_with_retries(key, body, attempts=write_retries, backoff=0.5):
+    for attempt in range(1, attempts + 1):
+        try:
+            s3.put_object(Bucket=bucket, Key=key, Body=body)
+            return
+        except Exception as e:
+            if attempt == attempts:
+                raise
+            log(f"Retrying {key} (attempt {attempt} failed: {e})")
+            time.sleep(backoff * 2 ** (attempt - 1))
+
+def output_keys(df):
+    if output_format == 'parquet':
+        return (
+            aggregated_parquet_prefix
+            + 'department=' + df['department'].astype(str).map(lambda d: quote(d, safe=''))
+            + '/date=' + df['date'].astype(str) + '/data.parquet'
+        )
+    return (
+        aggregated_prefix
+        + df['department'].astype(str).str.replace(' ', '_')
+        + '/' + df['date'].astype(str) + '.csv'
+    )
+
+def csv_bodies(df, keys):
+    """Serialize df as one CSV body per output key.
 
-log(f"Found {len(keys)} files in {clean_prefix}")
+    The whole frame goes through a single to_csv pass and its lines are
+    grouped by key, so no per-row DataFrames are built.
+    """
+    header, *lines = df.to_csv(index=False, lineterminator='\n').splitlines()
+    grouped_lines = {}
+    for key, line in zip(keys, lines):
+        grouped_lines.setdefault(key, []).append(line)
+    return {key: '\n'.join([header, *rows, '']).encode('utf-8') for key, rows in grouped_lines.items()}
 
-if not keys:
+def parquet_bodies(df, keys):
+    """Serialize df as one Parquet body per output key.
+
+    date and department are encoded in the key, so they are not stored.
+    """
+    bodies = {}
+    for key, group in df.drop(columns=['date', 'department']).groupby(keys.values, sort=False):
+        buffer = BytesIO()
+        group.to_parquet(buffer, index=False)
+        bodies[key] = buffer.getvalue()
+    return bodies
+
+def existing_rows(key, pending_partitions):
+    """Current rows of an aggregated partition, or None if it doesn't exist yet.
+
+    A partition whose last write failed is read from the manifest rather
+    than from S3, since the object in S3 is stale.
+    """
+    if key in pending_partitions:
+        df = pd.DataFrame(pending_partitions[key])
+    else:
+        try:
+            content = s3.get_object(Bucket=bucket, Key=key)['Body'].read()
+        except s3.exceptions.NoSuchKey:
+            return None
+        if output_format == 'parquet':
+            values = partition_values(key)
+            df = pd.read_parquet(BytesIO(content)).assign(date=values['date'], department=values['department'])
+        else:
+            df = pd.read_csv(BytesIO(content), dtype={'department': str, 'product_id': str})
+    df['date'] = pd.to_datetime(df['date']).dt.date
+    return df[group_columns + value_columns]
+
+# Step 2: List clean files and skip the ones already aggregated
+if input_format == 'parquet':
+    source_prefix, read_clean = clean_parquet_prefix, read_clean_parquet
+    keys = list_keys(source_prefix, '.parquet')
+else:
+    source_prefix, read_clean = clean_prefix, read_json_lines
+    keys = list_keys(source_prefix, '.json')
+
+log(f"Found {len(keys)} files in {source_prefix}")
+
+manifest = None if full_rebuild else load_manifest()
+if manifest is not None:
+    processed_keys, pending_partitions = manifest
+    keys = [key for key in keys if key not in processed_keys]
+    log(f"{len(keys)} new files since last run, {len(pending_partitions)} pending partitions")
+else:
+    if full_rebuild:
+        log("Full rebuild requested, ignoring manifest.")
+    else:
+        # Without a manifest, every clean file looks new. Merging them into the
+        # existing partitions would count them twice, so overwrite instead.
+        log("No manifest found. Rebuilding every partition from clean data.")
+        full_rebuild = True
+    processed_keys, pending_partitions = set(), {}
+
+if not keys and not pending_partitions:
     log("No files found. Exiting.")
     sys.exit(0)
 
-# Step 3: Load and concatenate all JSON records
-all_records = []
-for key in keys:
-    try:
-        obj = s3.get_object(Bucket=bucket, Key=key)
-        content = obj['Body'].read()
-        df = pd.read_json(BytesIO(content), lines=True)
-        all_records.append(df)
-    except Exception as e:
-        log(f"Failed to process {key}: {e}")
-
-if not all_records:
-    log("No valid records to process.")
-    sys.exit(0)
+# Step 3: Load and concatenate all clean records
+frames, failed_keys = run_all(keys, read_clean, max_workers, 'process')
+all_records = [frames[key] for key in keys if key in frames]
 
-full_df = pd.concat(all_records, ignore_index=True)
+log(f"Loaded {len(all_records)} of {len(keys)} files with {max_workers} workers ({len(failed_keys)} failed)")
 
-# Step 4: Timestamp normalization and grouping
-full_df['timestamp'] = pd.to_datetime(full_df['timestamp'], utc=True, errors='coerce')
-full_df['date'] = full_df['timestamp'].dt.date
+grouped = pd.DataFrame(columns=group_columns + value_columns)
+if all_records:
+    full_df = pd.concat(all_records, ignore_index=True)
 
-grouped = (
-    full_df.groupby(['date', 'department'])
-           .agg({'price_numeric': 'sum'})
-           .reset_index()
-           .rename(columns={'price_numeric': 'total_sales'})
+    # Step 4: Timestamp normalization and grouping
+    full_df['timestamp'] = pd.to_datetime(full_df['timestamp'], utc=True, errors='coerce')
+    full_df['date'] = full_df['timestamp'].dt.date
+
+    grouped = full_df.groupby(group_columns).agg(**aggregations).reset_index()
+    grouped_keys = output_keys(grouped)
+
+    # Step 4b: Merge the new sums into the affected partitions only
+    if not full_rebuild:
+        existing, failed_reads = run_all(
+            grouped_keys.unique(), lambda key: existing_rows(key, pending_partitions), max_workers, 'read'
+        )
+        if failed_reads:
+            # Nothing has been written yet, so the next run can safely retry
+            log(f"Could not read {len(failed_reads)} existing partitions. Aborting without writing.")
+            sys.exit(1)
+        existing_frames = [df for df in existing.values() if df is not None]
+        if existing_frames:
+            grouped = (
+                pd.concat([grouped, *existing_frames], ignore_index=True)
+                  .groupby(group_columns)[value_columns].sum()
+                  .reset_index()
+            )
+
+# Partitions that failed to write last time and received no new data
+merged_keys = set(output_keys(grouped))
+retry_rows = [row for key, rows in pending_partitions.items() if key not in merged_keys for row in rows]
+if retry_rows:
+    grouped = pd.concat([grouped, pd.DataFrame(retry_rows)], ignore_index=True)
+
+grouped_keys = output_keys(grouped)
+if output_format == 'parquet':
+    bodies = parquet_bodies(grouped, grouped_keys)
+else:
+    bodies = csv_bodies(grouped, grouped_keys)
+
+log(f"Writing {len(bodies)} aggregated files to S3...")
+
+# Step 5: Write one file per day per department
+written, failed_writes = run_all(
+    bodies, lambda key: put_with_retries(key, bodies[key]), max_workers, 'write'
 )
+bytes_written = sum(len(bodies[key]) for key in written)
+
+log(f"Wrote {len(written)} objects ({bytes_written} bytes), {len(failed_writes)} failed")
 
-log(f"Writing {len(grouped)} aggregated files to S3...")
-
-# Step 5: Write CSV per day per department
-for _, row in grouped.iterrows():
-    try:
-        output_key = f"{aggregated_prefix}{row['department'].replace(' ', '_')}/{row['date']}.csv"
-        csv_data = row.to_frame().T.to_csv(index=False)
-        s3.put_object(Bucket=bucket, Key=output_key, Body=csv_data)
-        log(f"Written: {output_key}")
-    except Exception as e:
-        log(f"Failed to write {output_key}: {e}")
+# Step 6: Record what was aggregated. Rows that failed to write hold
+# absolute totals, so they are kept in the manifest and retried next run.
+pending = {}
+for key, row in zip(grouped_keys, grouped.astype({'date': str}).to_dict('records')):
+    if key in failed_writes:
+        pending.setdefault(key, []).append(row)
+processed_keys.update(frames)
+save_manifest(processed_keys, pending)
 
 log("Aggregation complete.")
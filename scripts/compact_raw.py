@@ -0,0 +1,133 @@
+import sys
+import json
+import hashlib
+import boto3
+from datetime import datetime, timezone
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from awsglue.utils import getResolvedOptions
+
+# Get job parameters passed via CDK
+args = getResolvedOptions(sys.argv, ['JOB_NAME', 'BUCKET_NAME'])
+
+def get_optional_arg(name, default):
+    # getResolvedOptions fails on arguments that were not passed to the job
+    if f"--{name}" in sys.argv:
+        return getResolvedOptions(sys.argv, [name])[name]
+    return default
+
+max_workers = int(get_optional_arg('MAX_WORKERS', 16))
+# Upper bound on the raw bytes merged into one batch file
+max_batch_bytes = int(get_optional_arg('MAX_BATCH_BYTES', 128 * 1024 * 1024))
+# Remove raw objects once their batch and the manifest are written
+delete_sources = get_optional_arg('DELETE_SOURCES', 'false').lower() == 'true'
+
+raw_bucket = args['BUCKET_NAME']
+raw_prefix = "raw/"
+compacted_prefix = "compacted/"
+manifest_key = "manifests/compaction/manifest.json"
+
+s3 = boto3.client('s3', config=Config(max_pool_connections=max_workers))
+
+def log(msg):
+    print(f"[Compaction] {msg}")
+
+def list_raw_objects(bucket, prefix):
+    paginator = s3.get_paginator('list_objects_v2')
+    objects = []
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        objects.extend(obj for obj in page.get('Contents', []) if obj['Key'].endswith('.json'))
+    return objects
+
+def load_manifest():
+    """Return {batch key: [source keys]} for every batch written so far."""
+    try:
+        obj = s3.get_object(Bucket=raw_bucket, Key=manifest_key)
+    except s3.exceptions.NoSuchKey:
+        return {}
+    return json.loads(obj['Body'].read()).get('batches', {})
+
+def save_manifest(batches):
+    manifest = {'updated_at': datetime.utcnow().isoformat(), 'batches': batches}
+    s3.put_object(Bucket=raw_bucket, Key=manifest_key, Body=json.dumps(manifest))
+
+def plan_batches(objects):
+    """Group objects into batches by the hour they were written, split by size.
+
+    Only hours that have already closed are compacted, so a batch's contents
+    (and therefore its key) never change between runs.
+    """
+    current_hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    by_hour = {}
+    for obj in objects:
+        hour = obj['LastModified'].astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        if hour < current_hour:
+            by_hour.setdefault(hour, []).append(obj)
+
+    batches = []
+    for hour, hour_objects in sorted(by_hour.items()):
+        batch, size = [], 0
+        for obj in sorted(hour_objects, key=lambda o: o['Key']):
+            if batch and size + obj['Size'] > max_batch_bytes:
+                batches.append((hour, batch))
+                batch, size = [], 0
+            batch.append(obj['Key'])
+            size += obj['Size']
+        batches.append((hour, batch))
+    return batches
+
+def batch_key(hour, source_keys):
+    # Derived from the sources, so re-running a batch overwrites the same object
+    digest = hashlib.sha1('\n'.join(source_keys).encode('utf-8')).hexdigest()[:16]
+    return f"{compacted_prefix}{hour:%Y/%m/%d/%H}/batch-{digest}.json"
+
+def read_record_lines(key):
+    # Raw objects hold one record or a newline-delimited ingestion batch.
+    # Re-serialize so every record occupies exactly one line.
+    obj = s3.get_object(Bucket=raw_bucket, Key=key)
+    content = obj['Body'].read().decode('utf-8')
+    return [json.dumps(json.loads(line)) for line in content.splitlines() if line.strip()]
+
+def write_batch(key, source_keys, pool):
+    lines = [line for record_lines in pool.map(read_record_lines, source_keys) for line in record_lines]
+    body = ('\n'.join(lines) + '\n').encode('utf-8')
+    s3.put_object(Bucket=raw_bucket, Key=key, Body=body)
+    return len(body)
+
+def delete_keys(keys):
+    for start in range(0, len(keys), 1000):
+        chunk = keys[start:start + 1000]
+        s3.delete_objects(Bucket=raw_bucket, Delete={'Objects': [{'Key': key} for key in chunk], 'Quiet': True})
+
+def main():
+    batches = load_manifest()
+    consumed = {key for sources in batches.values() for key in sources}
+
+    objects = [obj for obj in list_raw_objects(raw_bucket, raw_prefix) if obj['Key'] not in consumed]
+    planned = plan_batches(objects)
+    log(f"{len(objects)} unconsumed raw objects, {len(planned)} batches to write")
+
+    written = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for hour, source_keys in planned:
+            key = batch_key(hour, source_keys)
+            try:
+                size = write_batch(key, source_keys, pool)
+            except Exception as e:
+                log(f"Failed to write {key}: {e}")
+                continue
+            batches[key] = source_keys
+            written.append(key)
+            log(f"Wrote {key} ({len(source_keys)} source objects, {size} bytes)")
+
+    if written:
+        save_manifest(batches)
+
+    if delete_sources:
+        # Only sources recorded in the manifest are removed
+        consumed_now = [source for key in written for source in batches[key]]
+        delete_keys(consumed_now)
+        log(f"Deleted {len(consumed_now)} raw objects")
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,120 @@
 import sys
+import time
 import boto3
 import pandas as pd
+from io import BytesIO
+from urllib.parse import quote
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from awsglue.utils import getResolvedOptions
 
 # Get job parameters passed via CDK
 args = getResolvedOptions(sys.argv, ['JOB_NAME', 'BUCKET_NAME'])
 
+def get_optional_arg(name, default):
+    # getResolvedOptions fails on arguments that were not passed to the job
+    if f"--{name}" in sys.argv:
+        return getResolvedOptions(sys.argv, [name])[name]
+    return default
+
+# json keeps the original clean/ layout; parquet writes a partitioned layer
+output_format = get_optional_arg('OUTPUT_FORMAT', 'json').lower()
+max_workers = int(get_optional_arg('MAX_WORKERS', 16))
+# Re-transform files even if their clean output already exists
+overwrite = get_optional_arg('OVERWRITE', 'false').lower() == 'true'
+
 # Use bucket from arguments
 raw_bucket = args['BUCKET_NAME']
 raw_prefix = "raw/"
 clean_prefix = "clean/"
+clean_parquet_prefix = "clean_parquet/"
+# One empty marker per source, written once all of its partitions are written.
+# The leading underscore keeps Hive-style readers from treating it as data.
+clean_parquet_done_prefix = clean_parquet_prefix + "_done/"
+
+# raw/ holds ingested objects; compacted/ holds the merged hourly batches
+source_prefix = get_optional_arg('SOURCE_PREFIX', raw_prefix)
+
+# Size the connection pool to the worker count so threads don't queue on it
+s3 = boto3.client('s3', config=Config(max_pool_connections=max_workers))
+
+def list_s3_objects(bucket, prefix, suffix='.json'):
+    paginator = s3.get_paginator('list_objects_v2')
+    keys = []
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        keys.extend(obj['Key'] for obj in page.get('Contents', []) if obj['Key'].endswith(suffix))
+    return keys
 
-s3 = boto3.client('s3')
+def file_name(key, prefix):
+    return key[len(prefix):].rsplit('.', 1)[0].replace('/', '_')
 
-def list_s3_objects(bucket, prefix):
-    response = s3.list_objects_v2(Bucket=bucket, Prefix=prefix)
-    return [obj['Key'] for obj in response.get('Contents', []) if obj['Key'].endswith('.json')]
+def pending_keys(source_keys):
+    """Drop source keys whose clean output was written by an earlier run."""
+    if output_format == 'parquet':
+        # A source writes several partitions, so only its marker proves they all exist
+        done = {key[len(clean_parquet_done_prefix):]
+                for key in list_s3_objects(raw_bucket, clean_parquet_done_prefix, '')}
+        return [key for key in source_keys if file_name(key, source_prefix) not in done]
+    done = set(list_s3_objects(raw_bucket, clean_prefix))
+    return [key for key in source_keys if key.replace(source_prefix, clean_prefix, 1) not in done]
 
 def process_file(key):
+    """Transform one source file into the clean layer and return the bytes read."""
     obj = s3.get_object(Bucket=raw_bucket, Key=key)
-    df = pd.read_json(obj['Body'])
+    content = obj['Body'].read()
+    # Every source object is newline-delimited: single records, ingestion
+    # batches and compacted batches alike
+    df = pd.read_json(BytesIO(content), lines=True)
 
     # Basic transformation
     df.drop(columns=['session_id'], inplace=True, errors='ignore')
     df.rename(columns={'sales_date': 'timestamp'}, inplace=True)
 
-    output_buffer = df.to_json(orient='records', lines=True)
-    s3.put_object(Bucket=raw_bucket, Key=key.replace(raw_prefix, clean_prefix), Body=output_buffer)
+    if output_format == 'parquet':
+        write_parquet_partitions(df, key)
+    else:
+        output_buffer = df.to_json(orient='records', lines=True)
+        s3.put_object(Bucket=raw_bucket, Key=key.replace(source_prefix, clean_prefix, 1), Body=output_buffer)
+    return len(content)
+
+def write_parquet_partitions(df, key):
+    """Write df under clean_parquet/department=<dept>/date=<YYYY-MM-DD>/.
+
+    department and date live in the path (hive-style), so readers can prune
+    partitions from the key alone and they are not stored in the file.
+    """
+    df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True, errors='coerce')
+    dates = df['timestamp'].dt.strftime('%Y-%m-%d').fillna('unknown')
+    name = file_name(key, source_prefix)
+    for (department, date), part in df.groupby([df['department'].astype(str), dates], sort=False):
+        buffer = BytesIO()
+        part.drop(columns=['department']).to_parquet(buffer, index=False)
+        output_key = f"{clean_parquet_prefix}department={quote(department, safe='')}/date={date}/{name}.parquet"
+        s3.put_object(Bucket=raw_bucket, Key=output_key, Body=buffer.getvalue())
+    s3.put_object(Bucket=raw_bucket, Key=clean_parquet_done_prefix + name, Body=b'')
 
 def main():
-    raw_keys = list_s3_objects(raw_bucket, raw_prefix)
-    for key in raw_keys:
-        process_file(key)
+    raw_keys = list_s3_objects(raw_bucket, source_prefix)
+    keys = raw_keys if overwrite else pending_keys(raw_keys)
+    print(f"Found {len(raw_keys)} files in {source_prefix}, {len(raw_keys) - len(keys)} already clean")
+
+    start = time.perf_counter()
+    processed, failed, bytes_read = 0, 0, 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(process_file, key): key for key in keys}
+        for future in as_completed(futures):
+            try:
+                bytes_read += future.result()
+                processed += 1
+            except Exception as e:
+                failed += 1
+                print(f"Failed to process {futures[future]}: {e}")
+    elapsed = max(time.perf_counter() - start, 1e-9)
+
+    print(
+        f"Processed {processed} files ({failed} failed) in {elapsed:.1f}s: "
+        f"{processed / elapsed:.1f} files/s, {bytes_read / elapsed / 1e6:.2f} MB/s"
+    )
 
 if __name__ == "__main__":
     main()